@@ -31,7 +31,8 @@ print("Project root:", PROJECT_ROOT)
 config = context.config
 
 # Override sqlalchemy.url with our dynamic URL from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# Alembic runs synchronously; strip the async driver suffix.
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("+asyncpg", ""))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -82,7 +83,7 @@ def run_migrations_online() -> None:
     from sqlalchemy import pool
 
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    configuration["sqlalchemy.url"] = settings.DATABASE_URL.replace("+asyncpg", "")
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
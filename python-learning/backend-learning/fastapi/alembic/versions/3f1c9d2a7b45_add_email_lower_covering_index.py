@@ -0,0 +1,35 @@
+"""add email_lower generated column and covering index
+
+Revision ID: 3f1c9d2a7b45
+Revises:
+Create Date: 2025-08-31 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9d2a7b45'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column(
+            'email_lower',
+            sa.String(),
+            sa.Computed('lower(email)', persisted=True),
+        ),
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX users_email_lower_idx ON users (email_lower) "
+        "INCLUDE (id, hashed_password, is_active, role)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('users_email_lower_idx', table_name='users')
+    op.drop_column('users', 'email_lower')
@@ -0,0 +1,33 @@
+"""convert users.role from enum to smallint
+
+Revision ID: b7d4e8f0c123
+Revises: 3f1c9d2a7b45
+Create Date: 2025-08-31 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4e8f0c123'
+down_revision = '3f1c9d2a7b45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN role TYPE smallint USING "
+        "(CASE role::text WHEN 'ADMIN' THEN 0 WHEN 'MANAGER' THEN 1 ELSE 2 END)"
+    )
+    op.alter_column('users', 'role', nullable=False, server_default='2')
+    op.execute("DROP TYPE IF EXISTS userrole")
+
+
+def downgrade() -> None:
+    op.execute("CREATE TYPE userrole AS ENUM ('ADMIN', 'MANAGER', 'USER')")
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN role TYPE userrole USING "
+        "(CASE role WHEN 0 THEN 'ADMIN' WHEN 1 THEN 'MANAGER' "
+        "ELSE 'USER' END)::userrole"
+    )
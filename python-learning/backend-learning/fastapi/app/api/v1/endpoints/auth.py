@@ -1,28 +1,30 @@
 from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import create_access_token
 from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.user import Token, User as UserSchema
-from app.services.user import authenticate_user
+from app.schemas.user import TOKEN_ADAPTER, User as UserSchema
+from app.services.user import UserService
 
 router = APIRouter()
+user_service = UserService()
 
-@router.post("/login", response_model=Token)
-def login(
-    db: Session = Depends(get_db),
+@router.post("/login")
+async def login(
+    db: AsyncSession = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await user_service.authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,18 +36,21 @@ def login(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
+    # Serialize through the precompiled TOKEN_ADAPTER, bypassing
+    # FastAPI's response_model re-validation pass.
+    token = TOKEN_ADAPTER.validate_python({
         "access_token": create_access_token(
             user.id, expires_delta=access_token_expires
         ),
         "token_type": "bearer",
-    }
+    })
+    return ORJSONResponse(TOKEN_ADAPTER.dump_python(token, mode="json"))
 
 @router.post("/test-token", response_model=UserSchema)
-def test_token(current_user: User = Depends(get_current_user)) -> Any:
+async def test_token(current_user: User = Depends(get_current_user)) -> Any:
     """
     Test access token
     """
-    return current_user 
\ No newline at end of file
+    return current_user
@@ -1,7 +1,9 @@
 from typing import Any, List
-from fastapi import APIRouter, Body, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import (
     get_current_active_user,
@@ -10,7 +12,7 @@ from app.core.deps import (
 )
 from app.db.session import get_db
 from app.models.user import User, UserRole
-from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.schemas.user import USER_ADAPTER, User as UserSchema, UserCreate, UserUpdate
 # from app.services.user import (
 #     create_user,
 #     get_user_by_email,
@@ -22,9 +24,19 @@ from app.services.user import UserService
 router = APIRouter()
 user_service = UserService()
 
-@router.get("/", response_model=List[UserSchema])
-def read_users(
-    db: Session = Depends(get_db),
+# Serializes the whole list in one pydantic-core call instead of one
+# Python-level encoder pass per user.
+USERS_ADAPTER: TypeAdapter[list[UserSchema]] = TypeAdapter(list[UserSchema])
+
+def _user_response(user: User) -> ORJSONResponse:
+    """Serialize one user through the precompiled USER_ADAPTER,
+    bypassing FastAPI's response_model re-validation pass."""
+    payload = USER_ADAPTER.validate_python(user, from_attributes=True)
+    return ORJSONResponse(USER_ADAPTER.dump_python(payload, mode="json"))
+
+@router.get("/")
+async def read_users(
+    db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_active_superuser),
@@ -32,72 +44,76 @@ def read_users(
     """
     Retrieve users.
     """
-    users = user_service.get_users(db, skip=skip, limit=limit)
-    return users
+    users = await user_service.get_users(db, skip=skip, limit=limit)
+    payload = USERS_ADAPTER.validate_python(users, from_attributes=True)
+    return Response(
+        content=USERS_ADAPTER.dump_json(payload),
+        media_type="application/json",
+    )
 
-@router.post("/", response_model=UserSchema)
-def create_user_endpoint(
+@router.post("/")
+async def create_user_endpoint(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: UserCreate,
     current_user: User = Depends(get_current_active_superuser),
 ) -> Any:
     """
     Create new user.
     """
-    user = user_service.get_user_by_email(db, email=user_in.email)
-    if user:
+    user = await user_service.create_user(db, user_in)
+    if not user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
-    user = user_service.create_user(db, user_in)
-    return user
+    return _user_response(user)
 
-@router.get("/me", response_model=UserSchema)
-def read_user_me(
+@router.get("/me")
+async def read_user_me(
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get current user.
     """
-    return current_user
+    return _user_response(current_user)
 
-@router.put("/me", response_model=UserSchema)
-def update_user_me(
+@router.put("/me")
+async def update_user_me(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: UserUpdate,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Update own user.
     """
-    user = user_service.update_user(db, db_user=current_user, user_in=user_in)
-    return user
+    user = await user_service.update_user(db, db_user=current_user, user_in=user_in)
+    return _user_response(user)
 
-@router.get("/{user_id}", response_model=UserSchema)
-def read_user_by_id(
+@router.get("/{user_id}")
+async def read_user_by_id(
     user_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Get a specific user by id.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if user == current_user:
-        return user
-    if not current_user.role == UserRole.ADMIN:
+        return _user_response(user)
+    if not current_user._is_admin:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
-    return user
+    return _user_response(user)
 
-@router.put("/{user_id}", response_model=UserSchema)
-def update_user_endpoint(
+@router.put("/{user_id}")
+async def update_user_endpoint(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int,
     user_in: UserUpdate,
     current_user: User = Depends(get_current_active_superuser),
@@ -105,11 +121,10 @@ def update_user_endpoint(
     """
     Update a user.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await user_service.update_user_by_id(db, user_id, user_in)
     if not user:
         raise HTTPException(
             status_code=404,
             detail="The user with this username does not exist in the system",
         )
-    user = user_service.update_user(db, db_user=user, user_in=user_in)
-    return user 
\ No newline at end of file
+    return _user_response(user)
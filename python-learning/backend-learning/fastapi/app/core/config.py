@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import List
-from pydantic_settings import BaseSettings
-from pydantic import AnyHttpUrl, validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AnyHttpUrl, field_validator
 from pathlib import Path
 from dotenv import load_dotenv
 import os
@@ -8,9 +9,6 @@ import os
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-# Load environment variables from .env file
-load_dotenv(dotenv_path=PROJECT_ROOT / '.env')
-
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "FastAPI Clean Architecture"
@@ -18,7 +16,8 @@ class Settings(BaseSettings):
     # CORS Configuration
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str] | str:
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
@@ -29,6 +28,12 @@ class Settings(BaseSettings):
     # Database Configuration
     DATABASE_URL: str = os.getenv("DATABASE_URL", "url")
 
+    # Connection pool tuning (per deployment). For concurrency beyond
+    # POOL_SIZE + MAX_OVERFLOW put PgBouncer (port 6432, transaction
+    # pooling) in front of the database as the connection multiplexer.
+    POOL_SIZE: int = int(os.getenv("POOL_SIZE", "20"))
+    MAX_OVERFLOW: int = int(os.getenv("MAX_OVERFLOW", "10"))
+
     # JWT Configuration
     SECRET_KEY: str = os.getenv("SECRET_KEY", "url")
     ALGORITHM: str = "HS256"
@@ -38,10 +43,19 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER_EMAIL: str = os.getenv("FIRST_SUPERUSER_EMAIL", "email")
     FIRST_SUPERUSER_PASSWORD: str = os.getenv("FIRST_SUPERUSER_PASSWORD", "password")
 
-    class Config:
-        case_sensitive = True
-        env_file = str(PROJECT_ROOT / '.env')
-        env_file_encoding = 'utf-8'
-
-# Create settings instance
-settings = Settings() 
\ No newline at end of file
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=str(PROJECT_ROOT / '.env'),
+        env_file_encoding='utf-8',
+    )
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings once; .env parsing and pydantic validation run
+    only on the first call (also usable as a FastAPI dependency)."""
+    load_dotenv(dotenv_path=PROJECT_ROOT / '.env')
+    return Settings()
+
+# Bound once at import for hot-path access; tests can use
+# get_settings.cache_clear() to rebuild after patching the environment.
+settings = get_settings()
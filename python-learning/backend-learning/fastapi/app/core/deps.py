@@ -3,7 +3,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import verify_password
@@ -15,8 +16,8 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     try:
@@ -29,7 +30,8 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    result = await db.execute(select(User).where(User.id == token_data.sub))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -39,6 +41,10 @@ def get_current_active_user(
 ) -> User:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    # Materialize the admin flag once per request so hot endpoints
+    # branch on a plain bool instead of walking the instrumented
+    # attribute and comparing enums on every check.
+    current_user._is_admin = current_user.role == UserRole.ADMIN
     return current_user
 
 def get_current_active_superuser(
@@ -58,4 +64,4 @@ def check_permissions(required_role: UserRole):
                 detail="Not enough permissions"
             )
         return current_user
-    return permission_checker 
\ No newline at end of file
+    return permission_checker
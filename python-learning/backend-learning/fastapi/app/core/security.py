@@ -1,10 +1,31 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union
 from jose import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from passlib.context import CryptContext
 from app.core.config import settings
 
+# New hashes use Argon2id with the OWASP-recommended parameters
+# (m=46 MiB, t=1, p=1, ~7 ms/hash); legacy bcrypt hashes still verify
+# through passlib until they are rehashed on login.
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_hasher = PasswordHasher(
+    time_cost=1,
+    memory_cost=46 * 1024,
+    parallelism=1,
+    hash_len=32,
+    salt_len=16,
+)
+
+# Bound methods hoisted once at import: a single global load per call
+# instead of re-walking the attribute chain through the hasher.
+_hash = password_hasher.hash
+_verify = password_hasher.verify
+_check_needs_rehash = password_hasher.check_needs_rehash
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -22,7 +43,37 @@ def create_access_token(
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return _verify(hashed_password, plain_password)
+    except InvalidHashError:
+        # Legacy bcrypt hash from before the Argon2id switch
+        return pwd_context.verify(plain_password, hashed_password)
+    except VerificationError:
+        return False
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password) 
\ No newline at end of file
+    return _hash(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return _check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+# Argon2 releases the GIL inside its C extension, so a dedicated pool
+# sized to the CPU count gives concurrent logins real parallelism
+# without starving the threadpool that services sync I/O. Intra-hash
+# parallelism stays at 1; we parallelize across requests instead.
+_KDF_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="argon2"
+)
+
+async def get_password_hash_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        _KDF_POOL, get_password_hash, password
+    )
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(
+        _KDF_POOL, verify_password, plain_password, hashed_password
+    )
@@ -7,4 +7,3 @@ from app.models.user import User, UserRole  # noqa
 
 # This is important for Alembic to detect all models
 __all__ = ["Base", "BaseModel", "User", "UserRole"]
-from app.models.user import User  # noqa
\ No newline at end of file
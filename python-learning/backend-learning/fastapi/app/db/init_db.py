@@ -1,19 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
-from app.services.user import create_user
 from app.schemas.user import UserCreate
+from app.services.user import UserService
 from app.models.user import UserRole, User
 
-def init_db(db: Session) -> None:
-    # Create first superuser
-    user = db.query(User).filter(User.email == settings.FIRST_SUPERUSER_EMAIL).first()
-    if not user:
-        """pass"""
-        # user_in = UserCreate(
-        #     email=settings.FIRST_SUPERUSER_EMAIL,
-        #     password=settings.FIRST_SUPERUSER_PASSWORD,
-        #     full_name="Initial Super User",
-        #     role=UserRole.ADMIN,
-        #     is_active=True,
-        # )
-        # create_user(db, user_in) 
\ No newline at end of file
+async def init_db(db: AsyncSession) -> None:
+    # Planner-cheap EXISTS subquery: no row materialization and no ORM
+    # hydration, just a boolean — the canonical shape for
+    # check-then-insert paths.
+    has_superuser = await db.scalar(
+        select(exists().where(User.email == settings.FIRST_SUPERUSER_EMAIL))
+    )
+    if not has_superuser:
+        user_in = UserCreate(
+            email=settings.FIRST_SUPERUSER_EMAIL,
+            password=settings.FIRST_SUPERUSER_PASSWORD,
+            full_name="Initial Super User",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        await UserService().create_user(db, user_in)
@@ -1,19 +1,19 @@
+import asyncio
 import logging
-from sqlalchemy.orm import Session
 from app.db.init_db import init_db
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def init() -> None:
-    db = SessionLocal()
-    init_db(db)
+async def init() -> None:
+    async with AsyncSessionLocal() as db:
+        await init_db(db)
 
 def main() -> None:
     logger.info("Creating initial data")
-    init()
+    asyncio.run(init())
     logger.info("Initial data created")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
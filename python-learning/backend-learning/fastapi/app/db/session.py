@@ -1,16 +1,41 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The engine needs the asyncpg driver; tolerate a plain postgresql://
+# URL in the environment. asyncpg prepares statements and caches them
+# per connection, so hot queries pay parse/plan once per connection.
+database_url = settings.DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
+
+engine = create_async_engine(
+    database_url,
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    connect_args={"statement_cache_size": 1024},
+)
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
+# Sync fallback for scripts and utilities that cannot run on the async
+# engine. The scoped_session registry hands back the same Session
+# within a context without per-call Depends wiring; callers must invoke
+# SyncSessionLocal.remove() when their unit of work ends.
+sync_engine = create_engine(
+    settings.DATABASE_URL.replace("+asyncpg", ""),
+    pool_pre_ping=True,
+)
+SyncSessionLocal = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+)
+
 # Dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close() 
\ No newline at end of file
+async def get_db():
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -1,17 +1,32 @@
-from sqlalchemy import Boolean, Column, String, Enum
+from sqlalchemy import Boolean, Column, Computed, Index, SmallInteger, String
 from app.models.base import BaseModel
 import enum
 
-class UserRole(str, enum.Enum):
-    ADMIN = "admin"
-    MANAGER = "manager"
-    USER = "user"
+class UserRole(enum.IntEnum):
+    ADMIN = 0
+    MANAGER = 1
+    USER = 2
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        # Covering index: login resolves entirely from an index-only
+        # scan on the lowercased email, never touching the heap.
+        Index(
+            "users_email_lower_idx",
+            "email_lower",
+            unique=True,
+            postgresql_include=["id", "hashed_password", "is_active", "role"],
+        ),
+    )
 
     email = Column(String, unique=True, index=True, nullable=False)
+    # Generated column so case-insensitive lookups stay on a b-tree
+    # index regardless of how the caller cased the address.
+    email_lower = Column(String, Computed("lower(email)", persisted=True))
     hashed_password = Column(String, nullable=False)
     full_name = Column(String)
     is_active = Column(Boolean, default=True)
-    role = Column(Enum(UserRole), default=UserRole.USER) 
\ No newline at end of file
+    # Plain SMALLINT: no per-row enum construction when hydrating list
+    # queries, and a 2-byte column instead of a native enum type.
+    role = Column(SmallInteger, nullable=False, default=UserRole.USER.value)
@@ -1,67 +1,214 @@
+import hashlib
+import threading
+import time
+from collections import namedtuple
 from typing import Optional
-from sqlalchemy.orm import Session
-from app.core.security import get_password_hash, verify_password
-from app.models.user import User
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from app.core.config import settings
+from app.core.security import (
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate
 
+# Short-TTL cache of successful password verifications so hot accounts
+# that re-authenticate in bursts skip the ~7 ms Argon2 KDF. The key is a
+# keyed blake2b digest of the password plus the email, never the
+# password itself.
+_AUTH_CACHE_TTL = 45  # seconds
+_AUTH_CACHE_MAX = 10_000
+_auth_cache: dict[bytes, tuple[int, float]] = {}
+_auth_cache_lock = threading.Lock()
+
+def _auth_cache_key(email: str, password: str) -> bytes:
+    digest = hashlib.blake2b(
+        password.encode(),
+        key=settings.SECRET_KEY.encode()[:64],
+        digest_size=16,
+    ).digest()
+    return digest + email.encode()
+
+def _auth_cache_store(key: bytes, user_id: int) -> None:
+    now = time.monotonic()
+    with _auth_cache_lock:
+        if len(_auth_cache) >= _AUTH_CACHE_MAX:
+            for stale in [k for k, (_, exp) in _auth_cache.items() if exp <= now]:
+                del _auth_cache[stale]
+        if len(_auth_cache) < _AUTH_CACHE_MAX:
+            _auth_cache[key] = (user_id, now + _AUTH_CACHE_TTL)
+
+def _auth_cache_lookup(key: bytes) -> Optional[int]:
+    with _auth_cache_lock:
+        entry = _auth_cache.get(key)
+        if entry is None:
+            return None
+        user_id, expiry = entry
+        if expiry <= time.monotonic():
+            del _auth_cache[key]
+            return None
+        return user_id
+
+def _auth_cache_invalidate(email: str) -> None:
+    suffix = email.encode()
+    with _auth_cache_lock:
+        for key in [k for k in _auth_cache if k.endswith(suffix)]:
+            del _auth_cache[key]
+
+# Lightweight row shape for the login path: no identity-map insertion,
+# no InstanceState allocation, just the four columns auth needs.
+AuthUser = namedtuple("AuthUser", "id hashed_password is_active role")
+
+_AUTH_COLUMNS = (User.id, User.hashed_password, User.is_active, User.role)
+
 class UserRepository:
     def __init__(self):
         # self.db = db
         """ """
 
-    def get_user_by_email(self, db: Session, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+    async def get_user_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        result = await db.execute(
+            select(User).where(User.email_lower == email.lower())
+        )
+        return result.scalar_one_or_none()
 
-    def get_user_by_id(self, db: Session, user_id: int) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+    async def get_user_by_id(self, db: AsyncSession, user_id: int) -> Optional[User]:
+        result = await db.execute(select(User).where(User.id == user_id))
+        return result.scalar_one_or_none()
 
-    def get_users(
-        self, db: Session, skip: int = 0, limit: int = 100
+    async def get_users(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100
     ) -> list[User]:
-        return db.query(User).offset(skip).limit(limit).all()
-
-    def create_user(db: Session, user_in: UserCreate) -> User:
-        db_user = User(
-            email=user_in.email,
-            hashed_password=get_password_hash(user_in.password),
-            full_name=user_in.full_name,
-            is_active=user_in.is_active,
-            role=user_in.role,
+        # raiseload("*") turns any accidental lazy load during
+        # serialization into an error instead of an N+1 query storm;
+        # relationships added to User later must be selectinload()-ed
+        # here explicitly.
+        result = await db.execute(
+            select(User).options(raiseload("*")).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def create_user(self, db: AsyncSession, user_in: UserCreate) -> Optional[User]:
+        # Single round-trip insert; a None result means the email is
+        # already taken (ON CONFLICT DO NOTHING), with no SELECT-then-
+        # INSERT race window.
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=user_in.email,
+                hashed_password=await get_password_hash_async(user_in.password),
+                full_name=user_in.full_name,
+                is_active=user_in.is_active,
+                role=user_in.role,
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
         )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        result = await db.execute(stmt)
+        db_user = result.scalar_one_or_none()
+        await db.commit()
         return db_user
 
-    def update_user(
-        self, db: Session, db_user: User, user_in: UserUpdate
+    async def create_users_bulk(
+        self, db: AsyncSession, users_in: list[UserCreate]
+    ) -> list[User]:
+        # One multi-row INSERT (one round-trip, one fsync) instead of a
+        # commit per user; duplicate emails are silently skipped.
+        if not users_in:
+            return []
+        rows = [
+            {
+                "email": user_in.email,
+                "hashed_password": await get_password_hash_async(user_in.password),
+                "full_name": user_in.full_name,
+                "is_active": user_in.is_active,
+                "role": user_in.role,
+            }
+            for user_in in users_in
+        ]
+        stmt = (
+            pg_insert(User)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
+        )
+        result = await db.execute(stmt, rows)
+        db_users = list(result.scalars().all())
+        await db.commit()
+        return db_users
+
+    async def update_user(
+        self, db: AsyncSession, db_user: User, user_in: UserUpdate
     ) -> User:
+        return await self.update_user_by_id(db, db_user.id, user_in)
+
+    async def update_user_by_id(
+        self, db: AsyncSession, user_id: int, user_in: UserUpdate
+    ) -> Optional[User]:
+        # Single UPDATE ... RETURNING round-trip: no pre-SELECT, no
+        # Python-side attribute mutation loop, no refresh. A None
+        # result means no row matched the id.
         update_data = user_in.model_dump(exclude_unset=True)
         if "password" in update_data:
-            hashed_password = get_password_hash(update_data["password"])
+            hashed_password = await get_password_hash_async(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
-        
-        for field, value in update_data.items():
-            setattr(db_user, field, value)
-        
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        result = await db.execute(stmt)
+        db_user = result.scalar_one_or_none()
+        await db.commit()
+        if db_user is not None and "hashed_password" in update_data:
+            _auth_cache_invalidate(db_user.email)
         return db_user
 
-    def authenticate_user(
-        self, db: Session, email: str, password: str
-    ) -> Optional[User]:
-        user = self.get_user_by_email(db, email)
+    async def get_auth_user(self, db: AsyncSession, email: str) -> Optional[AuthUser]:
+        result = await db.execute(
+            select(*_AUTH_COLUMNS).where(User.email_lower == email.lower())
+        )
+        row = result.first()
+        return AuthUser(*row) if row else None
+
+    async def authenticate_user(
+        self, db: AsyncSession, email: str, password: str
+    ) -> Optional[AuthUser]:
+        cache_key = _auth_cache_key(email, password)
+        cached_user_id = _auth_cache_lookup(cache_key)
+        if cached_user_id is not None:
+            result = await db.execute(
+                select(*_AUTH_COLUMNS).where(User.id == cached_user_id)
+            )
+            row = result.first()
+            if row:
+                return AuthUser(*row)
+        user = await self.get_auth_user(db, email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
+        _auth_cache_store(cache_key, user.id)
+        if password_needs_rehash(user.hashed_password):
+            # Migrate legacy bcrypt (or stale Argon2 parameter) hashes
+            # on successful login.
+            new_hash = await get_password_hash_async(password)
+            await db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(hashed_password=new_hash)
+            )
+            await db.commit()
         return user
 
     def is_active_user(self, user: User) -> bool:
         return user.is_active
 
     def is_superuser(self, user: User) -> bool:
-        return user.role == "admin" 
\ No newline at end of file
+        return user.role == UserRole.ADMIN
@@ -1,14 +1,25 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter, field_validator
 from typing import Optional
 from app.models.user import UserRole
 from datetime import datetime
 
+# Accepted alongside the SMALLINT values so pre-existing clients that
+# still send the old string literals keep working.
+_ROLE_NAMES = {"admin": UserRole.ADMIN, "manager": UserRole.MANAGER, "user": UserRole.USER}
+
 class UserBase(BaseModel):
     email: EmailStr
     full_name: Optional[str] = None
     is_active: Optional[bool] = True
     role: Optional[UserRole] = UserRole.USER
 
+    @field_validator("role", mode="before")
+    @classmethod
+    def coerce_role(cls, v):
+        if isinstance(v, str):
+            return _ROLE_NAMES.get(v.lower(), v)
+        return v
+
 class UserCreate(UserBase):
     password: str
 
@@ -34,4 +45,10 @@ class Token(BaseModel):
     token_type: str
 
 class TokenPayload(BaseModel):
-    sub: Optional[int] = None 
\ No newline at end of file
+    sub: Optional[int] = None
+
+# Adapters compiled once at import and shared by all handlers, so the
+# per-response cost is a single pydantic-core dispatch instead of a
+# fresh schema walk.
+USER_ADAPTER: TypeAdapter[User] = TypeAdapter(User)
+TOKEN_ADAPTER: TypeAdapter[Token] = TypeAdapter(Token) 
\ No newline at end of file
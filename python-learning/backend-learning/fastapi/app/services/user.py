@@ -1,23 +1,33 @@
-from app.repository.user import UserRepository
+from typing import Optional
+from app.repository.user import AuthUser, UserRepository
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):
-        self.user_repository = user_repository
-        
-    def get_users(self, db: Session, skip: int = 0, limit: int = 100) -> list[User]:
-        return self.user_repository.get_users(db, skip=skip, limit=limit)
-
-    def get_user_by_email(self, db: Session, email: str) -> User:
-        return self.user_repository.get_user_by_email(db, email)
-    
-    def get_user_by_id(self, db: Session, user_id: int) -> User:
-        return self.user_repository.get_user_by_id(db, user_id)
-    
-    def create_user(self, db: Session, user_in: UserCreate) -> User:
-        return self.user_repository.create_user(db, user_in)
-    
-    def update_user(self, db: Session, db_user: User, user_in: UserUpdate) -> User:
-        return self.user_repository.update_user(db, db_user, user_in)
\ No newline at end of file
+    def __init__(self, user_repository: Optional[UserRepository] = None):
+        self.user_repository = user_repository or UserRepository()
+
+    async def get_users(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> list[User]:
+        return await self.user_repository.get_users(db, skip=skip, limit=limit)
+
+    async def get_user_by_email(self, db: AsyncSession, email: str) -> User:
+        return await self.user_repository.get_user_by_email(db, email)
+
+    async def get_user_by_id(self, db: AsyncSession, user_id: int) -> User:
+        return await self.user_repository.get_user_by_id(db, user_id)
+
+    async def create_user(self, db: AsyncSession, user_in: UserCreate) -> User:
+        return await self.user_repository.create_user(db, user_in)
+
+    async def create_users_bulk(self, db: AsyncSession, users_in: list[UserCreate]) -> list[User]:
+        return await self.user_repository.create_users_bulk(db, users_in)
+
+    async def update_user(self, db: AsyncSession, db_user: User, user_in: UserUpdate) -> User:
+        return await self.user_repository.update_user(db, db_user, user_in)
+
+    async def update_user_by_id(self, db: AsyncSession, user_id: int, user_in: UserUpdate) -> Optional[User]:
+        return await self.user_repository.update_user_by_id(db, user_id, user_in)
+
+    async def authenticate_user(self, db: AsyncSession, email: str, password: str) -> Optional[AuthUser]:
+        return await self.user_repository.authenticate_user(db, email, password)
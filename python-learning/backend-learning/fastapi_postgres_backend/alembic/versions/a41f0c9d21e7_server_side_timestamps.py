@@ -0,0 +1,50 @@
+"""server-side timestamps
+
+Revision ID: a41f0c9d21e7
+Revises: debf3d6ae298
+Create Date: 2025-08-31 10:12:03.118245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f0c9d21e7'
+down_revision: Union[str, None] = 'debf3d6ae298'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE users SET created_at = now() WHERE created_at IS NULL")
+    op.execute("UPDATE users SET updated_at = now() WHERE updated_at IS NULL")
+    op.alter_column(
+        'users', 'created_at',
+        type_=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    )
+    op.alter_column(
+        'users', 'updated_at',
+        type_=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'users', 'updated_at',
+        type_=sa.DateTime(),
+        server_default=None,
+        nullable=True,
+    )
+    op.alter_column(
+        'users', 'created_at',
+        type_=sa.DateTime(),
+        server_default=None,
+        nullable=True,
+    )
@@ -0,0 +1,32 @@
+"""users list covering index
+
+Revision ID: c9d82e5b4f10
+Revises: a41f0c9d21e7
+Create Date: 2025-08-31 10:41:27.503914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d82e5b4f10'
+down_revision: Union[str, None] = 'a41f0c9d21e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'users_list_idx',
+        'users',
+        ['id'],
+        postgresql_include=['name', 'email', 'created_at', 'updated_at'],
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('users_list_idx', table_name='users')
@@ -1,20 +1,54 @@
-from fastapi import APIRouter, Depends
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas.user import UserCreate, UserOut
+from app.schemas.user import UserCreate, UserListAdapter, UserOut
+from app.core.cache import swr_cache
 from app.crud.user import create_user, get_users, update_user
-from app.db.session import get_db
+from app.db.session import DB_CONCURRENCY_LIMIT, get_db
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
-@router.post("/", response_model=UserOut)
-async def api_create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    return await create_user(db, user)
+def _db_sem(request: Request) -> asyncio.Semaphore:
+    """The write-concurrency semaphore set up in the app lifespan.
+
+    Lazily created when the lifespan didn't run (unit tests)."""
+    sem = getattr(request.app.state, "db_sem", None)
+    if sem is None:
+        sem = asyncio.Semaphore(DB_CONCURRENCY_LIMIT)
+        request.app.state.db_sem = sem
+    return sem
+
+# Responses are validated once with UserOut.model_validate in the
+# handler; response_model=None skips FastAPI's second validation pass.
+
+@router.post("/", response_model=None)
+async def api_create_user(
+    user: UserCreate, request: Request, db: AsyncSession = Depends(get_db)
+) -> UserOut:
+    async with _db_sem(request):
+        created = await create_user(db, user)
+    return UserOut.model_validate(created)
 
-@router.get("/", response_model=list[UserOut])
-async def api_get_users(db: AsyncSession = Depends(get_db)):
-    return await get_users(db)
+@router.get("/", response_model=None)
+@swr_cache("users:list", soft=30, hard=120)
+async def api_get_users(
+    db: AsyncSession = Depends(get_db), limit: int = 100, offset: int = 0
+) -> list[UserOut]:
+    users = await get_users(db, limit=limit, offset=offset)
+    # One pydantic-core call for the whole list; the plain-dict payload
+    # stays cacheable by @cache and is encoded by ORJSONResponse.
+    payload = UserListAdapter.validate_python(users, from_attributes=True)
+    return UserListAdapter.dump_python(payload, mode="json")
 
 #update user
-@router.put("/{user_id}", response_model=UserOut)
-async def api_update_user(user_id: int, user: UserCreate, db: AsyncSession = Depends(get_db)):
-    return await update_user(db, user_id, user)
+@router.put("/{user_id}", response_model=None)
+async def api_update_user(
+    user_id: int,
+    user: UserCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> UserOut:
+    async with _db_sem(request):
+        updated = await update_user(db, user_id, user)
+    return UserOut.model_validate(updated)
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+import orjson
+from fastapi import Response
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+_redis: Optional[aioredis.Redis] = None
+
+def _get_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+    return _redis
+
+async def close() -> None:
+    """Close the shared client (called from the app lifespan)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def _cache_key(namespace: str, kwargs: dict) -> str:
+    params = ":".join(
+        f"{name}={value}"
+        for name, value in sorted(kwargs.items())
+        if isinstance(value, (bool, int, float, str))
+    )
+    return f"swr:{namespace}:{params}"
+
+async def _store(redis: aioredis.Redis, key: str, body: bytes, hard: int) -> None:
+    # A hash of {body, generated_at}: body holds the final JSON bytes so
+    # hits skip Pydantic and orjson entirely. The hard TTL is enforced
+    # by Redis itself: once it passes, the key is gone and the next
+    # request refreshes synchronously (a miss).
+    await redis.hset(key, mapping={"body": body, "generated_at": time.time()})
+    await redis.expire(key, hard)
+
+async def _refresh(
+    fn: Callable, key: str, kwargs: dict, soft: int, hard: int
+) -> None:
+    from app.db.session import AsyncSessionLocal
+
+    redis = _get_redis()
+    try:
+        # SET NX single-flights the refresh across workers; the lock
+        # lives one soft window, so a crashed refresh retries later.
+        if not await redis.set(f"{key}:lock", b"1", nx=True, ex=soft):
+            return
+        call_kwargs = {k: v for k, v in kwargs.items() if k != "db"}
+        async with AsyncSessionLocal() as db:
+            body = await fn(db=db, **call_kwargs)
+        await _store(redis, key, orjson.dumps(body), hard)
+    except Exception:
+        # Background refresh is best-effort; the stale entry stays.
+        pass
+
+def swr_cache(namespace: str, soft: int = 30, hard: int = 120):
+    """Stale-while-revalidate cache for JSON-serializable handlers.
+
+    Cached entries are the final JSON bytes of the response body, so a
+    hit costs one Redis read and a socket write — no Pydantic pass and
+    no re-encode. Fresh entries (younger than `soft` seconds) are served
+    straight from Redis. Stale-but-alive entries are still served
+    immediately while a single background task re-runs the handler, so
+    cache expiry never stalls a request or stampedes the database; past
+    `hard` seconds the
+    key has expired and the next request refreshes synchronously. Fails
+    open (runs the handler) whenever Redis is unreachable.
+
+    The handler must take its session as a `db` keyword so the
+    background refresh can re-run it on a fresh session; the cache key
+    is built from the scalar keyword arguments (query params).
+    """
+
+    def decorator(fn: Callable):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            redis = _get_redis()
+            key = _cache_key(namespace, kwargs)
+            try:
+                entry = await redis.hgetall(key)
+            except Exception:
+                return await fn(*args, **kwargs)
+            if entry:
+                # Hit: hand the stored bytes straight to the socket —
+                # zero Pydantic work, zero JSON encode.
+                if time.time() - float(entry[b"generated_at"]) > soft:
+                    asyncio.create_task(_refresh(fn, key, kwargs, soft, hard))
+                return Response(
+                    content=entry[b"body"], media_type="application/json"
+                )
+            payload = await fn(*args, **kwargs)
+            body = orjson.dumps(payload)
+            try:
+                await _store(redis, key, body, hard)
+            except Exception:
+                pass
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+async def invalidate(namespace: str) -> None:
+    """Drop every cached entry in a namespace (called after writes)."""
+    redis = _get_redis()
+    try:
+        async for key in redis.scan_iter(match=f"swr:{namespace}:*"):
+            await redis.delete(key)
+    except Exception:
+        pass
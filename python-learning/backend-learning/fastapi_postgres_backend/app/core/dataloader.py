@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into a single execution.
+
+    Callers that arrive while a call for the same key is in flight await
+    the same future instead of re-running the work — DataLoader-style
+    de-duplication, so a thundering herd for one query costs the
+    database one query."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await coro_fn()
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved for the no-waiter case
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
@@ -1,26 +1,98 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.core import cache
+from app.core.dataloader import SingleFlight
 from app.models.user import User
 from app.schemas.user import UserCreate
 from fastapi import HTTPException
 
+async def _invalidate_users_cache():
+    """Drop cached /users responses after a write. Fails open (no-op)
+    when Redis is unreachable, e.g. in unit tests."""
+    await cache.invalidate("users:list")
+
 async def create_user(db: AsyncSession, user_in: UserCreate):
-    user = User(**user_in.model_dump())
-    db.add(user)
+    # ON CONFLICT DO NOTHING makes a duplicate email a no-op index probe
+    # instead of an IntegrityError + rollback; RETURNING brings back the
+    # server-generated columns in the same round-trip (no refresh()).
+    # The tests run on SQLite, which has its own ON CONFLICT construct.
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = (
+        insert(User)
+        .values(**user_in.model_dump())
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(status_code=409, detail="email exists")
     await db.commit()
-    await db.refresh(user)
+    await _invalidate_users_cache()
     return user
 
-async def get_users(db: AsyncSession):
-    result = await db.execute(select(User))
-    return result.scalars().all()
+# The columns UserOut serializes; selecting them directly keeps the
+# SELECT list minimal and skips ORM entity construction entirely.
+_USER_OUT_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.created_at,
+    User.updated_at,
+    User.is_deleted,
+)
+
+async def bulk_create_users(db: AsyncSession, user_ins: list[UserCreate]):
+    """Insert a whole batch in one executemany round-trip instead of one
+    INSERT + commit per user; duplicate emails are skipped in-statement."""
+    if not user_ins:
+        return
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    rows = [user_in.model_dump() for user_in in user_ins]
+    await db.execute(
+        insert(User).on_conflict_do_nothing(index_elements=["email"]), rows
+    )
+    await db.commit()
+    await _invalidate_users_cache()
+
+# De-duplicates identical list reads that are in flight at the same
+# moment; results are immutable Row tuples, safe to share.
+_singleflight = SingleFlight()
+
+async def get_users(db: AsyncSession, limit: int = 100, offset: int = 0):
+    # Core column select: rows come back as plain Row tuples with no
+    # identity map, attribute instrumentation or InstanceState per row,
+    # which is where the CPU goes on large lists. Pydantic reads the
+    # named-tuple attributes via from_attributes; writes keep the ORM path.
+    async def _fetch():
+        stmt = (
+            select(*_USER_OUT_COLUMNS)
+            .where(User.is_deleted == False)  # noqa: E712 - matches users_list_idx
+            .order_by(User.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await db.execute(stmt)
+        return result.all()
+
+    return await _singleflight.do(f"users:list:{limit}:{offset}", _fetch)
 
 #update_user
 async def update_user(db: AsyncSession, user_id: int, user_in: UserCreate):
-    user = await db.get(User, user_id)
+    # Single UPDATE ... RETURNING: no separate db.get() SELECT and no
+    # refresh() after commit.
+    stmt = (
+        update(User)
+        .where(User.id == user_id)
+        .values(**user_in.model_dump(exclude_unset=True))
+        .returning(User)
+    )
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    user.update(user_in.model_dump())
     await db.commit()
-    await db.refresh(user)
+    await _invalidate_users_cache()
     return user
@@ -1,7 +1,9 @@
-from app.crud.user import create_user
+from app.crud.user import bulk_create_users
 from app.core.config import settings
 from app.schemas.user import UserCreate
 
 async def init_db(session):
-    user = UserCreate(email=settings.FIRST_SUPERUSER_EMAIL, name="Admin")
-    await create_user(session, user)
+    # Seed rows go through the bulk path: one statement, one commit,
+    # re-runnable because duplicates are dropped by ON CONFLICT.
+    users = [UserCreate(email=settings.FIRST_SUPERUSER_EMAIL, name="Admin")]
+    await bulk_create_users(session, users)
@@ -1,12 +1,19 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, func
 from app.db.base_class import Base
-from datetime import datetime
 from sqlalchemy.types import DateTime
 
 class DBBaseModel(Base):
     __abstract__ = True
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now)
+    # Server-side timestamps: the database fills both columns inside the
+    # write statement itself, so bulk inserts need no per-row Python
+    # callback and updated_at stays correct on UPDATE.
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
     is_deleted = Column(Boolean, default=False)
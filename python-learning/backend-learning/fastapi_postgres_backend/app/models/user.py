@@ -1,7 +1,18 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, text
 from app.models.db_base import DBBaseModel
 
 class User(DBBaseModel):
     __tablename__ = "users"
+    # Covering index for the paginated list query: an ORDER BY id scan
+    # with every UserOut column in the INCLUDE list stays index-only,
+    # and the partial predicate matches the is_deleted filter.
+    __table_args__ = (
+        Index(
+            "users_list_idx",
+            "id",
+            postgresql_include=["name", "email", "created_at", "updated_at"],
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
     name = Column(String, index=True)
     email = Column(String, unique=True, index=True)
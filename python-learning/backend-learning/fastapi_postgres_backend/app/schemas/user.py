@@ -1,13 +1,19 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 from datetime import datetime
 
 class UserBase(BaseModel):
     email: str
     name: str
-    
+
 
 class UserCreate(UserBase):
-    pass
+    # Constraints live on the inbound model only so the checks compile
+    # into pydantic-core (Rust) and rows read back from the DB aren't
+    # re-validated against them on output.
+    email: EmailStr
+    name: str = Field(min_length=1, max_length=255)
+
+    model_config = ConfigDict(extra="forbid")
 
 class UserOut(UserBase):
     id: int
@@ -15,5 +21,11 @@ class UserOut(UserBase):
     updated_at: datetime
     is_deleted: bool
 
-    class Config:
-        orm_mode = True
+    # Pydantic v2 config; from_attributes replaces v1's orm_mode and the
+    # validator is compiled once at class definition.
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Compiled once at import; validates/serializes a whole list in a single
+# pydantic-core call instead of one Python-level pass per row.
+UserListAdapter: TypeAdapter[list[UserOut]] = TypeAdapter(list[UserOut])
@@ -1,46 +1,60 @@
 import pytest
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
-from httpx import AsyncClient
-
-# Try to import async_sessionmaker, fallback to sessionmaker for older SQLAlchemy
-try:
-    from sqlalchemy.ext.asyncio import async_sessionmaker
-    ASYNC_SESSIONMAKER_AVAILABLE = True
-except ImportError:
-    from sqlalchemy.orm import sessionmaker
-    ASYNC_SESSIONMAKER_AVAILABLE = False
+import httpx
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 from app.db.session import get_db
 from app.db.base import Base
+from app.models.user import User
 from app.schemas.user import UserCreate
 
 
-# Test database URL - using in-memory SQLite for testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-# Create async engine for testing
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args={"check_same_thread": False},
-    echo=False,
+# In-memory SQLite by default; set TEST_DATABASE_URL to a
+# postgresql+asyncpg:// URL to run the suite against a real Postgres.
+TEST_DATABASE_URL = os.environ.get(
+    "TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:"
 )
 
-# Create test session factory
-if ASYNC_SESSIONMAKER_AVAILABLE:
-    TestingSessionLocal = async_sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
+# Create async engine for testing
+if TEST_DATABASE_URL.startswith("sqlite"):
+    test_engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=False,
     )
+
+    # The pysqlite driver underneath aiosqlite ships legacy transaction
+    # handling and never emits BEGIN on its own, so the outer
+    # connection.begin() in db_session would be a no-op and committed
+    # SAVEPOINTs would hit the database for real instead of rolling
+    # back. SQLAlchemy's documented workaround: disable the driver's
+    # implicit transactions and emit BEGIN from the engine's own begin
+    # event.
+    @event.listens_for(test_engine.sync_engine, "connect")
+    def _sqlite_disable_autobegin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine.sync_engine, "begin")
+    def _sqlite_emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 else:
-    TestingSessionLocal = sessionmaker(
-        bind=test_engine, class_=AsyncSession, expire_on_commit=False
+    # Sized so xdist workers and concurrent requests don't serialize on
+    # pool checkout (the default 5+10 QueuePool is easy to exhaust).
+    test_engine = create_async_engine(
+        TEST_DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        echo=False,
     )
 
-
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """Create an instance of the default event loop for the test session."""
@@ -49,9 +63,10 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 async def setup_database():
-    """Set up test database and create tables."""
+    """Create the schema once per session; per-test isolation comes from
+    the rolled-back outer transaction in db_session."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -61,45 +76,58 @@ async def setup_database():
 
 @pytest.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async with TestingSessionLocal() as session:
-        yield session
+    """Session joined to an outer transaction that is rolled back after
+    each test. Commits inside the app land on a SAVEPOINT, so teardown
+    undoes everything without re-creating the schema."""
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
-@pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with database session."""
-    
-    async def override_get_db():
+@pytest.fixture(autouse=True)
+def override_get_db(db_session: AsyncSession) -> Generator:
+    """Point the app at this test's transactional session."""
+    async def _get_db():
         yield db_session
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    # Version-agnostic approach for testing FastAPI with httpx
-    try:
-        # Try the newer approach first
-        from httpx import ASGITransport
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as ac:
-            yield ac
-    except (ImportError, TypeError):
-        try:
-            # Try the app parameter approach
-            async with AsyncClient(
-                app=app,
-                base_url="http://test"
-            ) as ac:
-                yield ac
-        except TypeError:
-            # Fallback to basic client (this won't work for ASGI testing)
-            async with AsyncClient(base_url="http://test") as ac:
-                yield ac
-    
+
+    app.dependency_overrides[get_db] = _get_db
+    yield
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """One shared AsyncClient (and ASGI transport) for the whole session.
+
+    Building a client per test re-creates the transport and connection
+    pool ~30 times per run; the per-test DB wiring lives in
+    override_get_db, so tests stay isolated through the rolled-back
+    transaction, not through fresh clients.
+
+    Connection limits and keepalive expiry are network concepts that
+    only add bookkeeping against an in-process ASGI app, so they're
+    disabled outright."""
+    transport = ASGITransport(app=app, raise_app_exceptions=True)
+    limits = httpx.Limits(
+        max_connections=None,
+        max_keepalive_connections=None,
+        keepalive_expiry=None,
+    )
+    async with AsyncClient(
+        transport=transport, base_url="http://test", limits=limits
+    ) as ac:
+        yield ac
+
+
 @pytest.fixture
 def test_user_data() -> dict:
     """Sample user data for testing."""
@@ -128,6 +156,37 @@ def test_users_data() -> list[dict]:
     ]
 
 
+async def create_user(client: AsyncClient, data: dict) -> int:
+    """POST a user, assert success and return its id. Collapses the
+    create prologue repeated across tests into one call site and parses
+    the response JSON exactly once."""
+    response = await client.post("/users/", json=data)
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+@pytest.fixture
+async def created_user(client: AsyncClient, test_user_data: dict) -> int:
+    """The create_user helper applied to the sample user, for tests that
+    don't care about the payload. Function-scoped: class scope can't
+    outlive the per-test transaction the row lives in."""
+    return await create_user(client, test_user_data)
+
+
+@pytest.fixture
+async def seeded_users(
+    db_session: AsyncSession, test_users_data: list[dict]
+) -> list[User]:
+    """Bulk-insert the sample users straight through the session so
+    read-only tests skip N HTTP POST round-trips. Function-scoped on
+    purpose: the rows live inside the test's rolled-back transaction,
+    which a module-scoped fixture would escape."""
+    users = [User(**data) for data in test_users_data]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
 # Configure pytest-asyncio
 pytest_plugins = ["pytest_asyncio"]
 
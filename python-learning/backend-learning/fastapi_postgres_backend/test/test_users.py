@@ -2,6 +2,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.user import UserCreate
+from test.conftest import create_user
 
 
 @pytest.mark.asyncio
@@ -52,12 +53,11 @@ class TestUserCreate:
     async def test_create_user_duplicate_email(self, client: AsyncClient, test_user_data: dict):
         """Test user creation with duplicate email."""
         # Create first user
-        response1 = await client.post("/users/", json=test_user_data)
-        assert response1.status_code == 200
-        
+        await create_user(client, test_user_data)
+
         # Try to create second user with same email
-        response2 = await client.post("/users/", json=test_user_data)
-        assert response2.status_code == 400  # Bad request for duplicate
+        response = await client.post("/users/", json=test_user_data)
+        assert response.status_code == 409  # Conflict for duplicate
 
 
 @pytest.mark.asyncio
@@ -72,13 +72,12 @@ class TestUserRead:
         data = response.json()
         assert data == []
     
-    async def test_get_users_with_data(self, client: AsyncClient, test_users_data: list[dict]):
+    async def test_get_users_with_data(
+        self, client: AsyncClient, seeded_users, test_users_data: list[dict]
+    ):
         """Test getting users when database has data."""
-        # Create users first
-        for user_data in test_users_data:
-            await client.post("/users/", json=user_data)
-        
-        # Get all users
+        # Data is seeded by direct bulk insert; only the read goes
+        # through HTTP.
         response = await client.get("/users/")
         
         assert response.status_code == 200
@@ -95,13 +94,12 @@ class TestUserRead:
             assert "updated_at" in data[i]
             assert data[i]["is_deleted"] is False
     
-    async def test_get_user_by_id_success(self, client: AsyncClient, test_user_data: dict):
+    async def test_get_user_by_id_success(
+        self, client: AsyncClient, created_user: int, test_user_data: dict
+    ):
         """Test getting a specific user by ID."""
-        # Create user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
+        user_id = created_user
+
         # Get user by ID
         response = await client.get(f"/users/{user_id}")
         
@@ -130,13 +128,10 @@ class TestUserRead:
 class TestUserUpdate:
     """Test user update endpoints - TDD Approach."""
     
-    async def test_update_user_success(self, client: AsyncClient, test_user_data: dict):
+    async def test_update_user_success(self, client: AsyncClient, created_user: int):
         """Test successful user update."""
-        # Create a user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
+        user_id = created_user
+
         # Update the user
         update_data = {"name": "Updated User", "email": "updated@example.com"}
         response = await client.put(f"/users/{user_id}", json=update_data)
@@ -164,28 +159,20 @@ class TestUserUpdate:
         
         assert response.status_code == 422  # Validation error for path parameter
     
-    async def test_update_user_missing_data(self, client: AsyncClient, test_user_data: dict):
+    async def test_update_user_missing_data(self, client: AsyncClient, created_user: int):
         """Test updating user with missing data."""
-        # Create a user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
         # Try to update with missing data
-        response = await client.put(f"/users/{user_id}", json={})
+        response = await client.put(f"/users/{created_user}", json={})
         
         assert response.status_code == 422  # Validation error
     
-    async def test_update_user_partial_data(self, client: AsyncClient, test_user_data: dict):
+    async def test_update_user_partial_data(
+        self, client: AsyncClient, created_user: int, test_user_data: dict
+    ):
         """Test updating user with partial data."""
-        # Create a user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
         # Update only name
         update_data = {"name": "Updated Name Only"}
-        response = await client.put(f"/users/{user_id}", json=update_data)
+        response = await client.put(f"/users/{created_user}", json=update_data)
         
         assert response.status_code == 200
         data = response.json()
@@ -198,13 +185,10 @@ class TestUserUpdate:
 class TestUserDelete:
     """Test user deletion endpoints - TDD Approach."""
     
-    async def test_delete_user_success(self, client: AsyncClient, test_user_data: dict):
+    async def test_delete_user_success(self, client: AsyncClient, created_user: int):
         """Test successful user deletion."""
-        # Create a user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
+        user_id = created_user
+
         # Delete the user
         response = await client.delete(f"/users/{user_id}")
         
@@ -227,13 +211,10 @@ class TestUserDelete:
         
         assert response.status_code == 422  # Validation error
     
-    async def test_delete_already_deleted_user(self, client: AsyncClient, test_user_data: dict):
+    async def test_delete_already_deleted_user(self, client: AsyncClient, created_user: int):
         """Test deleting an already deleted user."""
-        # Create a user first
-        create_response = await client.post("/users/", json=test_user_data)
-        assert create_response.status_code == 200
-        user_id = create_response.json()["id"]
-        
+        user_id = created_user
+
         # Delete the user first time
         delete_response1 = await client.delete(f"/users/{user_id}")
         assert delete_response1.status_code == 200
@@ -301,10 +282,7 @@ class TestUserIntegration:
         """Test complete user lifecycle: create, read, update, delete."""
         # Create user
         user_data = {"name": "Integration User", "email": "integration@example.com"}
-        create_response = await client.post("/users/", json=user_data)
-        assert create_response.status_code == 200
-        created_user = create_response.json()
-        user_id = created_user["id"]
+        user_id = await create_user(client, user_data)
         
         # Verify user was created
         get_response = await client.get("/users/")
@@ -345,12 +323,15 @@ class TestUserIntegration:
     
     async def test_multiple_users_operations(self, client: AsyncClient, test_users_data: list[dict]):
         """Test operations with multiple users."""
+        # Deliberately serial: every request in a test runs on the same
+        # transactional AsyncSession (see override_get_db), and sessions
+        # reject concurrent statements, so asyncio.gather here would
+        # fail with "another operation is in progress". Cross-test
+        # parallelism comes from xdist workers instead.
         # Create multiple users
-        created_users = []
-        for user_data in test_users_data:
-            response = await client.post("/users/", json=user_data)
-            assert response.status_code == 200
-            created_users.append(response.json())
+        created_ids = [
+            await create_user(client, user_data) for user_data in test_users_data
+        ]
         
         # Verify all users were created
         get_response = await client.get("/users/")
@@ -359,12 +340,12 @@ class TestUserIntegration:
         assert len(users) == len(test_users_data)
         
         # Update each user
-        for i, user in enumerate(created_users):
+        for user_id, user_data in zip(created_ids, test_users_data):
             update_data = {
-                "name": f"Updated {test_users_data[i]['name']}",
-                "email": f"updated.{test_users_data[i]['email']}"
+                "name": f"Updated {user_data['name']}",
+                "email": f"updated.{user_data['email']}"
             }
-            response = await client.put(f"/users/{user['id']}", json=update_data)
+            response = await client.put(f"/users/{user_id}", json=update_data)
             assert response.status_code == 200
             
             updated_user = response.json()
@@ -372,8 +353,8 @@ class TestUserIntegration:
             assert updated_user["email"] == update_data["email"]
         
         # Delete all users
-        for user in created_users:
-            response = await client.delete(f"/users/{user['id']}")
+        for user_id in created_ids:
+            response = await client.delete(f"/users/{user_id}")
             assert response.status_code == 200
         
         # Verify all users are deleted
@@ -387,15 +368,14 @@ class TestUserIntegration:
 class TestUserErrorHandling:
     """Test error handling scenarios - TDD Approach."""
     
+    @pytest.mark.skip(reason="not implemented: requires mocking the database connection")
     async def test_database_connection_error(self, client: AsyncClient, test_user_data: dict):
         """Test handling of database connection errors."""
-        # This would require mocking the database connection
-        # For now, we'll test basic error handling
         pass
-    
+
+    @pytest.mark.skip(reason="not implemented: race-condition scenarios")
     async def test_concurrent_user_creation(self, client: AsyncClient, test_user_data: dict):
         """Test concurrent user creation scenarios."""
-        # This would test race conditions
         pass
     
     async def test_malformed_json_request(self, client: AsyncClient):
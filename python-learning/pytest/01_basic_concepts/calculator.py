@@ -1,49 +1,81 @@
 """
 Simple calculator module for demonstrating pytest testing.
 """
+import collections
+import functools
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the scalar paths still work
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; loops fall back to pure Python
+    njit = None
+
+
+# History op codes: entries are stored as (op, a, b, result) tuples and
+# only turned into strings when someone asks for them.
+_ADD, _SUB, _MUL, _DIV, _POW = range(5)
+_HISTORY_FORMATS = {
+    _ADD: "{} + {} = {}",
+    _SUB: "{} - {} = {}",
+    _MUL: "{} * {} = {}",
+    _DIV: "{} / {} = {}",
+    _POW: "{} ^ {} = {}",
+}
+
 
 class Calculator:
     """A simple calculator class with basic arithmetic operations."""
-    
-    def __init__(self):
-        self.history = []
-    
+
+    # Slots skip the per-instance __dict__, and the bounded deque keeps
+    # long-running instances from growing history without limit.
+    __slots__ = ("history",)
+
+    def __init__(self, history_size=10_000):
+        self.history = collections.deque(maxlen=history_size)
+
     def add(self, a, b):
         """Add two numbers."""
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append((_ADD, a, b, result))
         return result
-    
+
     def subtract(self, a, b):
         """Subtract b from a."""
         result = a - b
-        self.history.append(f"{a} - {b} = {result}")
+        self.history.append((_SUB, a, b, result))
         return result
-    
+
     def multiply(self, a, b):
         """Multiply two numbers."""
         result = a * b
-        self.history.append(f"{a} * {b} = {result}")
+        self.history.append((_MUL, a, b, result))
         return result
-    
+
     def divide(self, a, b):
         """Divide a by b."""
         if b == 0:
             raise ValueError("Cannot divide by zero")
         result = a / b
-        self.history.append(f"{a} / {b} = {result}")
+        self.history.append((_DIV, a, b, result))
         return result
-    
+
     def power(self, base, exponent):
         """Raise base to the power of exponent."""
         result = base ** exponent
-        self.history.append(f"{base} ^ {exponent} = {result}")
+        self.history.append((_POW, base, exponent, result))
         return result
-    
+
     def get_history(self):
-        """Get calculation history."""
-        return self.history.copy()
-    
+        """Get calculation history as formatted strings."""
+        return [
+            _HISTORY_FORMATS[op].format(a, b, result)
+            for op, a, b, result in self.history
+        ]
+
     def clear_history(self):
         """Clear calculation history."""
         self.history.clear()
@@ -51,33 +83,133 @@ class Calculator:
 
 def validate_number(value):
     """Validate that a value is a number."""
-    if not isinstance(value, (int, float)):
-        raise TypeError("Value must be a number")
-    return value
+    # Exact type identity beats isinstance with a tuple in per-element
+    # loops: two `is` checks, no tuple build, no MRO walk. bool is kept
+    # explicitly since isinstance(True, int) used to accept it.
+    t = type(value)
+    if t is int or t is float or t is bool:
+        return value
+    raise TypeError("Value must be a number")
 
 
 def calculate_average(numbers):
     """Calculate the average of a list of numbers."""
-    if not numbers:
+    # Generators and other unsized iterables can only be walked once,
+    # so materialize them before len() and the numpy conversion.
+    if not hasattr(numbers, "__len__"):
+        numbers = list(numbers)
+    if len(numbers) == 0:
         raise ValueError("Cannot calculate average of empty list")
-    
+
+    if np is not None:
+        # One vectorized dtype check and one C-level mean instead of a
+        # per-element validate/sum loop in bytecode. Kind "b" (bool) is
+        # accepted to match validate_number, which keeps bool on purpose.
+        arr = np.asarray(numbers)
+        if arr.dtype.kind in "biuf":
+            return float(arr.mean())
+        if arr.dtype.kind != "O":
+            raise TypeError("Value must be a number")
+        # Object arrays (e.g. arbitrarily large ints) take the
+        # element-wise path below.
+
     validated_numbers = [validate_number(n) for n in numbers]
     return sum(validated_numbers) / len(validated_numbers)
 
 
+def _sieve_of_eratosthenes(limit):
+    """Return the set of primes up to limit (bytearray sieve, one pass)."""
+    sieve = bytearray(b"\x01") * (limit + 1)
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytearray(len(range(i * i, limit + 1, i)))
+    return {i for i, flag in enumerate(sieve) if flag}
+
+
+# Precomputed once at import: small inputs become a set lookup and the
+# sorted list serves as the divisor set for larger inputs.
+_SMALL_PRIME_LIMIT = 10_000
+_SMALL_PRIMES = _sieve_of_eratosthenes(_SMALL_PRIME_LIMIT)
+_SMALL_PRIME_LIST = sorted(_SMALL_PRIMES)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_prime_large(n):
+    """Trial division for n beyond the sieve, memoized per value."""
+    limit = int(n ** 0.5)
+    for p in _SMALL_PRIME_LIST:
+        if p > limit:
+            return True
+        if n % p == 0:
+            return False
+    # sqrt(n) can exceed the sieve only for n > 10_000**2; finish with
+    # the remaining odd candidates.
+    for i in range(_SMALL_PRIME_LIMIT + 1, limit + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
 def is_prime(n):
     """Check if a number is prime."""
-    if n < 2:
-        return False
-    if n == 2:
-        return True
+    if n <= _SMALL_PRIME_LIMIT:
+        return n in _SMALL_PRIMES
     if n % 2 == 0:
         return False
-    
-    for i in range(3, int(n ** 0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+    return _is_prime_large(n)
+
+
+def is_prime_array(numbers):
+    """Vectorized primality check: returns a bool array (requires numpy).
+
+    Builds one sieve up to max(numbers) and answers every element with a
+    single fancy-index lookup instead of per-element trial division.
+    """
+    if np is None:
+        raise ImportError("numpy is required for is_prime_array")
+    arr = np.asarray(numbers)
+    if arr.dtype.kind not in "iu":
+        raise TypeError("Value must be an integer")
+    result = np.zeros(arr.shape, dtype=bool)
+    if arr.size == 0:
+        return result
+    limit = int(arr.max())
+    if limit < 2:
+        return result
+    sieve = np.zeros(limit + 1, dtype=bool)
+    sieve[2:] = True
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = False
+    non_negative = arr >= 0
+    result[non_negative] = sieve[arr[non_negative]]
+    return result
+
+
+def _fibonacci_loop(n):
+    a, b = 0, 1
+    for _ in range(2, n + 1):
+        a, b = b, a + b
+    return b
+
+
+# The add/swap loop is pure integer compute, exactly what numba turns
+# into straight-line native code.
+_fibonacci_jit = njit(cache=True)(_fibonacci_loop) if njit is not None else None
+
+
+def _fib_pair(n):
+    """Fast doubling: return (F(n), F(n+1)) in O(log n) multiplies
+    using F(2k) = F(k)*(2*F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2."""
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
 
 
 def fibonacci(n):
@@ -86,8 +218,13 @@ def fibonacci(n):
         raise ValueError("Fibonacci is not defined for negative numbers")
     if n <= 1:
         return n
-    
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b 
\ No newline at end of file
+
+    # Small n: the straight loop wins (and is JIT-compiled when numba
+    # is present; fibonacci(93) is the first int64 overflow, so 64 is
+    # comfortably safe). Large n: fast doubling turns O(n) big-int adds
+    # into O(log n) multiplies.
+    if n < 64:
+        if _fibonacci_jit is not None:
+            return int(_fibonacci_jit(n))
+        return _fibonacci_loop(n)
+    return _fib_pair(n)[0] 
\ No newline at end of file
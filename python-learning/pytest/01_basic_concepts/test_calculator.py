@@ -4,6 +4,13 @@ Tests for the calculator module.
 import pytest
 from calculator import Calculator, validate_number, calculate_average, is_prime, fibonacci
 
+# Parametrize tables built once at module import. The prime cases all
+# expect True and the non-prime cases all expect False, so the expected
+# column is collapsed away entirely.
+_PRIME_CASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
+_NON_PRIME_CASES = (0, 1, 4, 6, 8, 9, 10, 12, 14, 15, 16, 18, 20)
+_FIBONACCI_CASES = tuple(enumerate((0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55)))
+
 
 class TestCalculator:
     """Test cases for the Calculator class."""
@@ -11,84 +18,84 @@ class TestCalculator:
     def test_calculator_initialization(self):
         """Test calculator initialization."""
         calc = Calculator()
-        assert calc.history == []
+        assert list(calc.history) == []
     
     def test_add_positive_numbers(self):
         """Test addition with positive numbers."""
         calc = Calculator()
         result = calc.add(5, 3)
         assert result == 8
-        assert calc.history == ["5 + 3 = 8"]
+        assert calc.get_history() == ["5 + 3 = 8"]
     
     def test_add_negative_numbers(self):
         """Test addition with negative numbers."""
         calc = Calculator()
         result = calc.add(-5, -3)
         assert result == -8
-        assert calc.history == ["-5 + -3 = -8"]
+        assert calc.get_history() == ["-5 + -3 = -8"]
     
     def test_add_zero(self):
         """Test addition with zero."""
         calc = Calculator()
         result = calc.add(5, 0)
         assert result == 5
-        assert calc.history == ["5 + 0 = 5"]
+        assert calc.get_history() == ["5 + 0 = 5"]
     
     def test_subtract_positive_numbers(self):
         """Test subtraction with positive numbers."""
         calc = Calculator()
         result = calc.subtract(10, 4)
         assert result == 6
-        assert calc.history == ["10 - 4 = 6"]
+        assert calc.get_history() == ["10 - 4 = 6"]
     
     def test_subtract_negative_result(self):
         """Test subtraction that results in negative number."""
         calc = Calculator()
         result = calc.subtract(3, 8)
         assert result == -5
-        assert calc.history == ["3 - 8 = -5"]
+        assert calc.get_history() == ["3 - 8 = -5"]
     
     def test_multiply_positive_numbers(self):
         """Test multiplication with positive numbers."""
         calc = Calculator()
         result = calc.multiply(6, 7)
         assert result == 42
-        assert calc.history == ["6 * 7 = 42"]
+        assert calc.get_history() == ["6 * 7 = 42"]
     
     def test_multiply_by_zero(self):
         """Test multiplication by zero."""
         calc = Calculator()
         result = calc.multiply(5, 0)
         assert result == 0
-        assert calc.history == ["5 * 0 = 0"]
+        assert calc.get_history() == ["5 * 0 = 0"]
     
     def test_divide_positive_numbers(self):
         """Test division with positive numbers."""
         calc = Calculator()
         result = calc.divide(10, 2)
         assert result == 5.0
-        assert calc.history == ["10 / 2 = 5.0"]
+        assert calc.get_history() == ["10 / 2 = 5.0"]
     
     def test_divide_by_zero(self):
         """Test division by zero raises exception."""
         calc = Calculator()
         with pytest.raises(ValueError, match="Cannot divide by zero"):
             calc.divide(10, 0)
-        assert calc.history == []  # No history entry for failed operation
+        assert list(calc.history) == []  # No history entry for failed operation
     
     def test_power_positive_numbers(self):
         """Test power operation with positive numbers."""
         calc = Calculator()
         result = calc.power(2, 3)
         assert result == 8
-        assert calc.history == ["2 ^ 3 = 8"]
+        assert calc.get_history() == ["2 ^ 3 = 8"]
     
     def test_power_zero_exponent(self):
         """Test power operation with zero exponent."""
         calc = Calculator()
         result = calc.power(5, 0)
         assert result == 1
-        assert calc.history == ["5 ^ 0 = 1"]
+        assert calc.get_history() == ["5 ^ 0 = 1"]
     
     def test_get_history(self):
         """Test getting calculation history."""
@@ -109,7 +116,7 @@ class TestCalculator:
         calc.subtract(5, 3)
         assert len(calc.history) == 2
         calc.clear_history()
-        assert calc.history == []
+        assert list(calc.history) == []
 
 
 class TestValidateNumber:
@@ -168,23 +175,12 @@ class TestCalculateAverage:
 class TestIsPrime:
     """Test cases for the is_prime function."""
     
-    @pytest.mark.parametrize("number,expected", [
-        (2, True),
-        (3, True),
-        (5, True),
-        (7, True),
-        (11, True),
-        (13, True),
-        (17, True),
-        (19, True),
-        (23, True),
-        (29, True),
-    ])
-    def test_prime_numbers(self, number, expected):
+    @pytest.mark.parametrize("number", _PRIME_CASES)
+    def test_prime_numbers(self, number):
         """Test that known prime numbers return True."""
-        assert is_prime(number) == expected
-    
-    @pytest.mark.parametrize("number", [0, 1, 4, 6, 8, 9, 10, 12, 14, 15, 16, 18, 20])
+        assert is_prime(number)
+
+    @pytest.mark.parametrize("number", _NON_PRIME_CASES)
     def test_non_prime_numbers(self, number):
         """Test that known non-prime numbers return False."""
         assert is_prime(number) == False
@@ -198,19 +194,7 @@ class TestIsPrime:
 class TestFibonacci:
     """Test cases for the fibonacci function."""
     
-    @pytest.mark.parametrize("n,expected", [
-        (0, 0),
-        (1, 1),
-        (2, 1),
-        (3, 2),
-        (4, 3),
-        (5, 5),
-        (6, 8),
-        (7, 13),
-        (8, 21),
-        (9, 34),
-        (10, 55),
-    ])
+    @pytest.mark.parametrize("n,expected", _FIBONACCI_CASES)
     def test_fibonacci_numbers(self, n, expected):
         """Test that fibonacci function returns correct values."""
         assert fibonacci(n) == expected
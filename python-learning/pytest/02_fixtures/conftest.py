@@ -4,25 +4,152 @@ This file is automatically discovered by pytest and fixtures defined here
 are available to all test files in this directory and subdirectories.
 """
 import pytest
-import tempfile
-import os
+import sys
 import json
+import types
+import functools
 from typing import Dict, List, Any
 
 
-@pytest.fixture
+# Helper classes for the fixtures below. Defined once at import so each
+# fixture call only instantiates; a class statement inside the fixture
+# body would rebuild the type object and its method table every call.
+
+
+class _User:
+    """Simple user object returned by sample_user."""
+
+    def __init__(self, name, age, email):
+        self.name = name
+        self.age = age
+        self.email = email
+
+    def get_info(self):
+        return f"{self.name} ({self.age}) - {self.email}"
+
+
+class _FactoryUser:
+    """User object produced by the user_factory fixture."""
+
+    def __init__(self, name, age, email, role="user"):
+        self.name = name
+        self.age = age
+        self.email = email
+        self.role = role
+
+    def is_adult(self):
+        return self.age >= 18
+
+    def get_display_name(self):
+        return f"{self.name} ({self.role})"
+
+
+class _MockConnection:
+    """Mock database connection handed out by database_connection."""
+
+    __slots__ = ("connected", "transactions")
+
+    def __init__(self):
+        self.connected = True
+        self.transactions = []
+
+    def execute(self, query):
+        self.transactions.append(query)
+        return {"rows_affected": 1}
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.transactions.clear()
+
+    def close(self):
+        self.connected = False
+
+
+class _MockAPIClient:
+    """Mock API client handed out by api_client."""
+
+    __slots__ = ("base_url", "authenticated", "requests", "username")
+
+    def __init__(self):
+        self.base_url = "https://api.example.com"
+        self.authenticated = False
+        self.requests = []
+
+    def authenticate(self, username, password):
+        self.authenticated = True
+        self.username = username
+        return {"token": "mock_token_123"}
+
+    def get(self, endpoint):
+        self.requests.append(("GET", endpoint))
+        return {"status": 200, "data": {"message": "Success"}}
+
+    def post(self, endpoint, data):
+        self.requests.append(("POST", endpoint, data))
+        return {"status": 201, "data": data}
+
+    def logout(self):
+        self.authenticated = False
+
+
+class _MockExternalService:
+    """Mock external service handed out by mock_external_service."""
+
+    __slots__ = ("calls", "responses")
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {}
+
+    def set_response(self, method, endpoint, response):
+        # Interned endpoints hash/compare by pointer on the lookup side.
+        self.responses[(method, sys.intern(endpoint))] = response
+
+    def get(self, endpoint):
+        self.calls.append(("GET", endpoint))
+        return self.responses.get(("GET", endpoint), {"status": "success"})
+
+    def post(self, endpoint, data):
+        self.calls.append(("POST", endpoint, data))
+        return self.responses.get(("POST", endpoint), {"status": "created"})
+
+    def get_call_count(self):
+        return len(self.calls)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_user(name="John", age=30, email="john@example.com", role="user"):
+    """Factory function returned by user_factory; module-level because it
+    captures no per-test state.
+
+    Memoized on the argument tuple: repeated requests for the same user
+    across tests return the one cached instance instead of building a
+    new object each time. Callers must treat the returned users as
+    read-only — mutating one would leak into every other test asking
+    for the same arguments."""
+    return _FactoryUser(name=name, age=age, email=email, role=role)
+
+
+# The fixtures below return read-only sample data, so they are
+# session-scoped: pytest builds each value once and hands the same
+# object to every test instead of re-running the fixture body.
+
+
+@pytest.fixture(scope="session")
 def sample_numbers():
     """Basic fixture returning a list of numbers."""
     return [1, 2, 3, 4, 5]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_strings():
     """Fixture returning a list of strings."""
     return ["apple", "banana", "cherry", "date", "elderberry"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dict():
     """Fixture returning a dictionary."""
     return {
@@ -33,247 +160,222 @@ def sample_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user():
     """Fixture returning a user object."""
-    class User:
-        def __init__(self, name, age, email):
-            self.name = name
-            self.age = age
-            self.email = email
-        
-        def get_info(self):
-            return f"{self.name} ({self.age}) - {self.email}"
-    
-    return User("Alice", 25, "alice@example.com")
+    return _User("Alice", 25, "alice@example.com")
+
+
+# Namespace constants for the scope-demo fixtures: attribute access is
+# a C-level LOAD_ATTR instead of a dict hash+lookup, and building them
+# at import means the fixtures allocate nothing per call.
+_SESSION_DATA = types.SimpleNamespace(
+    session_id="test_session_123",
+    start_time="2024-01-01T00:00:00Z",
+    config=types.SimpleNamespace(environment="test", debug=True),
+)
+
+_MODULE_DATA = types.SimpleNamespace(module_name="test_module", test_count=0)
+
+_CLASS_DATA = types.SimpleNamespace(class_name="TestClass", setup_complete=False)
 
 
 @pytest.fixture(scope="session")
 def session_data():
     """Session-scoped fixture that persists throughout the test session."""
-    return {
-        "session_id": "test_session_123",
-        "start_time": "2024-01-01T00:00:00Z",
-        "config": {
-            "environment": "test",
-            "debug": True
-        }
-    }
+    return _SESSION_DATA
 
 
 @pytest.fixture(scope="module")
 def module_data():
     """Module-scoped fixture that persists throughout the test module."""
-    return {
-        "module_name": "test_module",
-        "test_count": 0
-    }
+    return _MODULE_DATA
 
 
 @pytest.fixture(scope="class")
 def class_data():
     """Class-scoped fixture that persists throughout the test class."""
-    return {
-        "class_name": "TestClass",
-        "setup_complete": False
-    }
+    return _CLASS_DATA
 
 
-@pytest.fixture
-def temp_file():
-    """Fixture that creates a temporary file and cleans it up."""
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        f.write("This is a temporary test file.\n")
-        f.write("It will be automatically cleaned up.\n")
-        temp_path = f.name
-    
-    # Provide the file path to the test
-    yield temp_path
-    
-    # Cleanup: remove the file after the test
-    try:
-        os.unlink(temp_path)
-    except FileNotFoundError:
-        pass  # File might already be deleted
+_TEMP_FILE_CONTENT = (
+    b"This is a temporary test file.\n"
+    b"It will be automatically cleaned up.\n"
+)
+
+
+@pytest.fixture(scope="module")
+def temp_file(tmp_path_factory):
+    """Fixture that creates a temporary file.
+
+    Module-scoped: one write per module instead of per test. Tests only
+    read the file, so sharing it is safe; use fresh_temp_file when a
+    test needs a file of its own. The file lives under pytest's
+    session temp directory, so cleanup happens in one batch at session
+    end instead of an unlink per fixture."""
+    path = tmp_path_factory.mktemp("data") / "sample.txt"
+    path.write_bytes(_TEMP_FILE_CONTENT)
+    return path
 
 
 @pytest.fixture
-def temp_json_file():
-    """Fixture that creates a temporary JSON file with sample data."""
-    data = {
-        "users": [
-            {"id": 1, "name": "Alice", "age": 25},
-            {"id": 2, "name": "Bob", "age": 30},
-            {"id": 3, "name": "Charlie", "age": 35}
-        ],
-        "settings": {
-            "theme": "dark",
-            "language": "en"
-        }
+def fresh_temp_file(tmp_path):
+    """Function-scoped variant of temp_file for tests that modify or
+    delete the file and therefore need one of their own."""
+    path = tmp_path / "sample.txt"
+    path.write_bytes(_TEMP_FILE_CONTENT)
+    return path
+
+
+# Encoded once at import: the fixture writes these bytes straight to the
+# file instead of re-walking the dict through json.dump on every setup.
+_JSON_BLOB = json.dumps({
+    "users": [
+        {"id": 1, "name": "Alice", "age": 25},
+        {"id": 2, "name": "Bob", "age": 30},
+        {"id": 3, "name": "Charlie", "age": 35}
+    ],
+    "settings": {
+        "theme": "dark",
+        "language": "en"
     }
-    
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-        json.dump(data, f)
-        temp_path = f.name
-    
-    yield temp_path
-    
-    try:
-        os.unlink(temp_path)
-    except FileNotFoundError:
-        pass
+}).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def temp_json_file(tmp_path_factory):
+    """Fixture that creates a temporary JSON file with sample data."""
+    path = tmp_path_factory.mktemp("data") / "sample.json"
+    path.write_bytes(_JSON_BLOB)
+    return path
 
 
 @pytest.fixture
-def database_connection():
+def database_connection(request):
     """Mock database connection fixture."""
-    class MockConnection:
-        def __init__(self):
-            self.connected = True
-            self.transactions = []
-        
-        def execute(self, query):
-            self.transactions.append(query)
-            return {"rows_affected": 1}
-        
-        def commit(self):
-            pass
-        
-        def rollback(self):
-            self.transactions.clear()
-        
-        def close(self):
-            self.connected = False
-    
-    connection = MockConnection()
+    connection = _MockConnection()
+    request.addfinalizer(connection.close)
+    return connection
+
+
+@pytest.fixture
+def api_client(request):
+    """Mock API client fixture."""
+    client = _MockAPIClient()
+    request.addfinalizer(client.logout)
+    return client
+
+
+# Mutable-vs-shared split: the function-scoped fixtures above hand each
+# test a private instance it may mutate freely. Tests that only read
+# (base_url, connected, default responses) can take the shared_*
+# variants below instead — one instance per session, with a cheap state
+# reset between tests in place of re-instantiation and close().
+
+
+@pytest.fixture(scope="session")
+def _shared_connection():
+    connection = _MockConnection()
     yield connection
     connection.close()
 
 
 @pytest.fixture
-def api_client():
-    """Mock API client fixture."""
-    class MockAPIClient:
-        def __init__(self):
-            self.base_url = "https://api.example.com"
-            self.authenticated = False
-            self.requests = []
-        
-        def authenticate(self, username, password):
-            self.authenticated = True
-            self.username = username
-            return {"token": "mock_token_123"}
-        
-        def get(self, endpoint):
-            self.requests.append(("GET", endpoint))
-            return {"status": 200, "data": {"message": "Success"}}
-        
-        def post(self, endpoint, data):
-            self.requests.append(("POST", endpoint, data))
-            return {"status": 201, "data": data}
-        
-        def logout(self):
-            self.authenticated = False
-    
-    client = MockAPIClient()
+def shared_database_connection(_shared_connection):
+    """Session-shared mock connection, rolled back after each test."""
+    yield _shared_connection
+    _shared_connection.rollback()
+
+
+@pytest.fixture(scope="session")
+def _shared_api_client():
+    client = _MockAPIClient()
     yield client
     client.logout()
 
 
 @pytest.fixture
-def user_factory():
-    """Fixture factory for creating user objects."""
-    class User:
-        def __init__(self, name, age, email, role="user"):
-            self.name = name
-            self.age = age
-            self.email = email
-            self.role = role
-        
-        def is_adult(self):
-            return self.age >= 18
-        
-        def get_display_name(self):
-            return f"{self.name} ({self.role})"
-    
-    def create_user(name="John", age=30, email="john@example.com", role="user"):
-        return User(name=name, age=age, email=email, role=role)
-    
-    return create_user
-
-
-@pytest.fixture(params=[1, 2, 3, 5, 8, 13])
-def fibonacci_number(request):
-    """Parametrized fixture providing Fibonacci numbers."""
-    return request.param
-
-
-@pytest.fixture(params=["admin", "user", "guest"])
-def user_role(request):
-    """Parametrized fixture providing different user roles."""
-    return request.param
+def shared_api_client(_shared_api_client):
+    """Session-shared mock API client, request log cleared per test."""
+    yield _shared_api_client
+    _shared_api_client.requests.clear()
+
+
+@pytest.fixture(scope="session")
+def _shared_external_service():
+    return _MockExternalService()
 
 
 @pytest.fixture
-def complex_data_structure():
-    """Fixture providing a complex nested data structure."""
-    return {
-        "company": {
-            "name": "TechCorp",
-            "employees": [
-                {
-                    "id": 1,
-                    "name": "Alice",
-                    "department": "Engineering",
-                    "skills": ["Python", "JavaScript"],
-                    "projects": [
-                        {"name": "Project A", "status": "active"},
-                        {"name": "Project B", "status": "completed"}
-                    ]
-                },
-                {
-                    "id": 2,
-                    "name": "Bob",
-                    "department": "Marketing",
-                    "skills": ["SEO", "Content"],
-                    "projects": [
-                        {"name": "Campaign X", "status": "active"}
-                    ]
-                }
-            ],
-            "departments": {
-                "Engineering": {"head": "Alice", "budget": 100000},
-                "Marketing": {"head": "Bob", "budget": 50000}
+def shared_external_service(_shared_external_service):
+    """Session-shared mock external service, wiped clean per test."""
+    yield _shared_external_service
+    _shared_external_service.calls.clear()
+    _shared_external_service.responses.clear()
+
+
+@pytest.fixture(scope="session")
+def user_factory():
+    """Fixture factory for creating user objects."""
+    return _create_user
+
+
+# Constant value matrices belong in @pytest.mark.parametrize on the
+# consuming test rather than in @pytest.fixture(params=...): parametrize
+# skips the per-param fixture setup/finalizer bookkeeping. E.g.:
+#
+#     @pytest.mark.parametrize("fibonacci_number", [1, 2, 3, 5, 8, 13])
+#     @pytest.mark.parametrize("user_role", ["admin", "user", "guest"])
+
+
+# Built once at import; the fixture hands out a read-only view so a
+# session-scoped value can't be mutated by one test under another's feet.
+_COMPLEX_DATA = {
+    "company": {
+        "name": "TechCorp",
+        "employees": (
+            {
+                "id": 1,
+                "name": "Alice",
+                "department": "Engineering",
+                "skills": ("Python", "JavaScript"),
+                "projects": (
+                    {"name": "Project A", "status": "active"},
+                    {"name": "Project B", "status": "completed"}
+                )
+            },
+            {
+                "id": 2,
+                "name": "Bob",
+                "department": "Marketing",
+                "skills": ("SEO", "Content"),
+                "projects": (
+                    {"name": "Campaign X", "status": "active"},
+                )
             }
+        ),
+        "departments": {
+            "Engineering": {"head": "Alice", "budget": 100000},
+            "Marketing": {"head": "Bob", "budget": 50000}
         }
     }
+}
+
+
+@pytest.fixture(scope="session")
+def complex_data_structure():
+    """Fixture providing a complex nested data structure."""
+    return types.MappingProxyType(_COMPLEX_DATA)
 
 
 @pytest.fixture
-def mock_external_service():
+def mock_external_service(request):
     """Fixture that mocks an external service."""
-    class MockExternalService:
-        def __init__(self):
-            self.calls = []
-            self.responses = {}
-        
-        def set_response(self, method, endpoint, response):
-            self.responses[(method, endpoint)] = response
-        
-        def get(self, endpoint):
-            self.calls.append(("GET", endpoint))
-            return self.responses.get(("GET", endpoint), {"status": "success"})
-        
-        def post(self, endpoint, data):
-            self.calls.append(("POST", endpoint, data))
-            return self.responses.get(("POST", endpoint), {"status": "created"})
-        
-        def get_call_count(self):
-            return len(self.calls)
-    
-    service = MockExternalService()
-    yield service
-    # Cleanup if needed
-    service.calls.clear()
-    service.responses.clear() 
\ No newline at end of file
+    service = _MockExternalService()
+
+    def _cleanup():
+        service.calls.clear()
+        service.responses.clear()
+
+    request.addfinalizer(_cleanup)
+    return service
\ No newline at end of file
@@ -6,34 +6,44 @@ import pytest
 
 def test_with_sample_numbers(sample_numbers):
     """Test using the sample_numbers fixture."""
-    assert len(sample_numbers) == 5
-    assert sum(sample_numbers) == 15
-    assert sample_numbers[0] == 1
-    assert sample_numbers[-1] == 5
+    # One tuple comparison instead of four assert blocks; pytest still
+    # shows which position differs on failure.
+    assert (
+        len(sample_numbers),
+        sum(sample_numbers),
+        sample_numbers[0],
+        sample_numbers[-1],
+    ) == (5, 15, 1, 5)
 
 
 def test_with_sample_strings(sample_strings):
     """Test using the sample_strings fixture."""
     assert len(sample_strings) == 5
     assert "apple" in sample_strings
-    assert all(isinstance(s, str) for s in sample_strings)
+    # map(type, ...) runs the element walk in C; one set comparison
+    # replaces a Python generator frame per element.
+    assert set(map(type, sample_strings)) == {str}
     assert sample_strings[0] == "apple"
 
 
 def test_with_sample_dict(sample_dict):
     """Test using the sample_dict fixture."""
-    assert sample_dict["name"] == "John Doe"
-    assert sample_dict["age"] == 30
-    assert len(sample_dict["skills"]) == 3
-    assert "Python" in sample_dict["skills"]
+    assert (
+        sample_dict["name"],
+        sample_dict["age"],
+        len(sample_dict["skills"]),
+        "Python" in sample_dict["skills"],
+    ) == ("John Doe", 30, 3, True)
 
 
 def test_with_sample_user(sample_user):
     """Test using the sample_user fixture."""
-    assert sample_user.name == "Alice"
-    assert sample_user.age == 25
-    assert sample_user.email == "alice@example.com"
-    assert sample_user.get_info() == "Alice (25) - alice@example.com"
+    assert (
+        sample_user.name,
+        sample_user.age,
+        sample_user.email,
+        sample_user.get_info(),
+    ) == ("Alice", 25, "alice@example.com", "Alice (25) - alice@example.com")
 
 
 def test_fixture_isolation():
@@ -77,9 +87,11 @@ def test_fixture_scope_demonstration(session_data, module_data, class_data):
     """Test demonstrating different fixture scopes."""
     # These fixtures have different scopes and will be created
     # at different times during the test session
-    assert session_data["session_id"] == "test_session_123"
-    assert module_data["module_name"] == "test_module"
-    assert class_data["class_name"] == "TestClass"
+    assert (
+        session_data.session_id,
+        module_data.module_name,
+        class_data.class_name,
+    ) == ("test_session_123", "test_module", "TestClass")
 
 
 def test_fixture_with_complex_data(complex_data_structure):
@@ -1,43 +1,110 @@
 """
 End-to-End workflow tests demonstrating complete system integration.
 """
+import asyncio
+import uuid
+
+import orjson
 import pytest
-import time
-from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from httpx import ASGITransport, AsyncClient
+from unittest.mock import DEFAULT, patch
+
+# Static request payloads, built once per module instead of per test.
+# Treat them as read-only: a test needing a variant should copy with
+# {**_ORDER_DATA, ...}. (Plain dicts rather than MappingProxyType —
+# the JSON serializer only accepts real dicts.)
+_ORDER_DATA = {
+    "shipping_address": "123 Main St, Anytown, USA",
+    "payment_method": "card"
+}
+
+_TEST_CARD = {
+    "card_number": "4242424242424242",
+    "expiry_month": "12",
+    "expiry_year": "2025",
+    "cvv": "123"
+}
+
+_NOTIFICATION_PREFS = {
+    "email_notifications": True,
+    "order_updates": True,
+    "promotional_emails": False
+}
+
+_SMS_PREFS = {
+    "sms_notifications": True,
+    "order_updates_sms": True
+}
+
+_PHONE_DATA = {
+    "phone_number": "+1234567890"
+}
+
+_PRODUCT_DATA = {
+    "name": "Test Product",
+    "description": "A test product for inventory management",
+    "price": 29.99,
+    "stock_quantity": 100,
+    "category": "Electronics"
+}
+
+
+# JSON goes through orjson on both directions: it serializes straight to
+# bytes and parses response.content noticeably faster than the stdlib
+# json that backs httpx's json= and response.json().
+
+def _loads(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+async def _request_json(client, method, path, obj, headers=None):
+    """Send a JSON payload pre-serialized with orjson"""
+    merged = {"content-type": "application/json"}
+    if headers:
+        merged.update(headers)
+    return await client.request(method, path, content=orjson.dumps(obj), headers=merged)
+
+
+async def _post_json(client, path, obj, headers=None):
+    return await _request_json(client, "POST", path, obj, headers)
+
+
+async def _put_json(client, path, obj, headers=None):
+    return await _request_json(client, "PUT", path, obj, headers)
 
 
 class TestUserWorkflow:
     """Test complete user workflows from registration to profile management."""
     
-    def test_user_registration_and_login_flow(self, api_client):
+    async def test_user_registration_and_login_flow(self, api_client, unique_user):
         """Test complete user registration and login workflow."""
         # Step 1: Register a new user
         registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
+            "username": unique_user,
+            "email": f"{unique_user}@example.com",
             "password": "securepass123",
             "full_name": "Test User"
         }
         
-        register_response = api_client.post("/api/users/register", json=registration_data)
+        register_response = await _post_json(api_client, "/api/users/register", registration_data)
         assert register_response.status_code == 201
         
-        user_data = register_response.json()
+        user_data = _loads(register_response)
         assert user_data["username"] == registration_data["username"]
         assert user_data["email"] == registration_data["email"]
         assert "id" in user_data
         
         # Step 2: Login with the new user
         login_data = {
-            "username": "testuser",
+            "username": unique_user,
             "password": "securepass123"
         }
         
-        login_response = api_client.post("/api/auth/login", data=login_data)
+        login_response = await api_client.post("/api/auth/login", data=login_data)
         assert login_response.status_code == 200
         
-        auth_data = login_response.json()
+        auth_data = _loads(login_response)
         assert "access_token" in auth_data
         assert "token_type" in auth_data
         
@@ -45,59 +112,59 @@ class TestUserWorkflow:
         headers = {"Authorization": f"Bearer {token}"}
         
         # Step 3: Access protected resources
-        profile_response = api_client.get("/api/users/profile", headers=headers)
+        profile_response = await api_client.get("/api/users/profile", headers=headers)
         assert profile_response.status_code == 200
         
-        profile_data = profile_response.json()
-        assert profile_data["username"] == "testuser"
-        assert profile_data["email"] == "test@example.com"
+        profile_data = _loads(profile_response)
+        assert profile_data["username"] == unique_user
+        assert profile_data["email"] == f"{unique_user}@example.com"
         
         # Step 4: Update profile
         update_data = {"full_name": "Updated Test User"}
-        update_response = api_client.put("/api/users/profile", json=update_data, headers=headers)
+        update_response = await _put_json(api_client, "/api/users/profile", update_data, headers=headers)
         assert update_response.status_code == 200
         
         # Step 5: Verify changes
-        profile_response = api_client.get("/api/users/profile", headers=headers)
-        updated_profile = profile_response.json()
+        profile_response = await api_client.get("/api/users/profile", headers=headers)
+        updated_profile = _loads(profile_response)
         assert updated_profile["full_name"] == "Updated Test User"
         
         # Step 6: Test logout
-        logout_response = api_client.post("/api/auth/logout", headers=headers)
+        logout_response = await api_client.post("/api/auth/logout", headers=headers)
         assert logout_response.status_code == 200
         
         # Step 7: Verify token is invalidated
-        profile_response = api_client.get("/api/users/profile", headers=headers)
+        profile_response = await api_client.get("/api/users/profile", headers=headers)
         assert profile_response.status_code == 401
     
-    def test_user_password_reset_flow(self, api_client):
+    async def test_user_password_reset_flow(self, api_client, _mock_services):
         """Test complete password reset workflow."""
         # Step 1: Request password reset
         reset_request_data = {"email": "test@example.com"}
-        reset_response = api_client.post("/api/auth/reset-password", json=reset_request_data)
+        reset_response = await _post_json(api_client, "/api/auth/reset-password", reset_request_data)
         assert reset_response.status_code == 200
         
         # Step 2: Verify reset email was sent (mock)
-        with patch('app.services.email_service.send_email') as mock_send_email:
-            mock_send_email.return_value = {"status": "sent"}
-            
-            # Simulate email sending
-            email_sent = mock_send_email("test@example.com", "Password Reset", "Reset link")
-            assert email_sent["status"] == "sent"
-            mock_send_email.assert_called_once()
-        
+        mock_send_email = _mock_services["email_service"].send_email
+        mock_send_email.return_value = {"status": "sent"}
+
+        # Simulate email sending
+        email_sent = mock_send_email("test@example.com", "Password Reset", "Reset link")
+        assert email_sent["status"] == "sent"
+        mock_send_email.assert_called_once()
+
         # Step 3: Reset password with token (mock token)
         reset_token = "mock_reset_token_123"
         new_password_data = {
             "token": reset_token,
             "new_password": "newsecurepass456"
         }
-        
-        with patch('app.services.auth_service.verify_reset_token') as mock_verify:
-            mock_verify.return_value = {"user_id": 1, "valid": True}
-            
-            reset_password_response = api_client.post("/api/auth/reset-password/confirm", json=new_password_data)
-            assert reset_password_response.status_code == 200
+
+        mock_verify = _mock_services["auth_service"].verify_reset_token
+        mock_verify.return_value = {"user_id": 1, "valid": True}
+
+        reset_password_response = await _post_json(api_client, "/api/auth/reset-password/confirm", new_password_data)
+        assert reset_password_response.status_code == 200
         
         # Step 4: Login with new password
         login_data = {
@@ -105,122 +172,119 @@ class TestUserWorkflow:
             "password": "newsecurepass456"
         }
         
-        login_response = api_client.post("/api/auth/login", data=login_data)
+        login_response = await api_client.post("/api/auth/login", data=login_data)
         assert login_response.status_code == 200
 
 
+async def _batch(client, steps, headers=None):
+    """Run a batch of requests in one helper call, returning responses
+    in order. Steps are (method, path, kwargs) tuples; shared auth
+    headers are applied here once per batch instead of per call site."""
+    responses = []
+    for method, path, kwargs in steps:
+        if "json" in kwargs:
+            responses.append(await _request_json(
+                client, method, path, kwargs["json"], headers=headers))
+            continue
+        if headers:
+            kwargs.setdefault("headers", headers)
+        responses.append(await client.request(method, path, **kwargs))
+    return responses
+
+
 class TestEcommerceWorkflow:
     """Test complete e-commerce workflows."""
     
-    def test_complete_purchase_workflow(self, api_client, authenticated_user):
+    async def test_complete_purchase_workflow(self, api_client, authenticated_user, _mock_services):
         """Test complete purchase from browsing to order confirmation."""
         user_id, token = authenticated_user
         headers = {"Authorization": f"Bearer {token}"}
         
         # Step 1: Browse products
-        products_response = api_client.get("/api/products", headers=headers)
+        products_response = await api_client.get("/api/products", headers=headers)
         assert products_response.status_code == 200
         
-        products = products_response.json()
+        products = _loads(products_response)
         assert len(products) > 0
         
         product = products[0]
         product_id = product["id"]
         
-        # Step 2: Add product to cart
+        # Steps 2-3 batched: add product to cart, then view the cart.
         cart_data = {
             "product_id": product_id,
             "quantity": 2
         }
-        
-        cart_response = api_client.post("/api/cart/items", json=cart_data, headers=headers)
-        assert cart_response.status_code == 201
-        
-        cart_item = cart_response.json()
+
+        add_response, cart_response = await _batch(api_client, [
+            ("POST", "/api/cart/items", {"json": cart_data}),
+            ("GET", "/api/cart", {}),
+        ], headers=headers)
+
+        assert add_response.status_code == 201
+        cart_item = _loads(add_response)
         assert cart_item["product_id"] == product_id
         assert cart_item["quantity"] == 2
-        
-        # Step 3: View cart
-        cart_response = api_client.get("/api/cart", headers=headers)
+
         assert cart_response.status_code == 200
-        
-        cart = cart_response.json()
+        cart = _loads(cart_response)
         assert len(cart["items"]) == 1
         assert cart["total_amount"] == product["price"] * 2
         
         # Step 4: Create order
-        order_data = {
-            "shipping_address": "123 Main St, Anytown, USA",
-            "payment_method": "card"
-        }
-        
-        order_response = api_client.post("/api/orders", json=order_data, headers=headers)
+        order_response = await _post_json(api_client, "/api/orders", _ORDER_DATA, headers=headers)
         assert order_response.status_code == 201
         
-        order = order_response.json()
+        order = _loads(order_response)
         assert order["status"] == "pending"
         assert order["user_id"] == user_id
         
         order_id = order["id"]
         
         # Step 5: Process payment
-        payment_data = {
-            "order_id": order_id,
-            "card_number": "4242424242424242",
-            "expiry_month": "12",
-            "expiry_year": "2025",
-            "cvv": "123"
-        }
+        payment_data = {"order_id": order_id, **_TEST_CARD}
         
-        with patch('app.services.payment_service.process_payment') as mock_payment:
-            mock_payment.return_value = {
-                "transaction_id": "txn_123",
-                "status": "succeeded",
-                "amount": order["total_amount"]
-            }
-            
-            payment_response = api_client.post("/api/payments", json=payment_data, headers=headers)
-            assert payment_response.status_code == 200
-            
-            payment_result = payment_response.json()
-            assert payment_result["status"] == "succeeded"
-        
-        # Step 6: Confirm order
-        confirm_response = api_client.put(f"/api/orders/{order_id}/confirm", headers=headers)
+        mock_payment = _mock_services["payment_service"].process_payment
+        mock_payment.return_value = {
+            "transaction_id": "txn_123",
+            "status": "succeeded",
+            "amount": order["total_amount"]
+        }
+
+        payment_response = await _post_json(api_client, "/api/payments", payment_data, headers=headers)
+        assert payment_response.status_code == 200
+
+        payment_result = _loads(payment_response)
+        assert payment_result["status"] == "succeeded"
+        
+        # Steps 6-8 batched: confirm the order, then verify its status
+        # and the cleared cart.
+        confirm_response, order_response, cart_response = await _batch(api_client, [
+            ("PUT", f"/api/orders/{order_id}/confirm", {}),
+            ("GET", f"/api/orders/{order_id}", {}),
+            ("GET", "/api/cart", {}),
+        ], headers=headers)
+
         assert confirm_response.status_code == 200
-        
-        # Step 7: Verify order status
-        order_response = api_client.get(f"/api/orders/{order_id}", headers=headers)
+
         assert order_response.status_code == 200
-        
-        final_order = order_response.json()
+        final_order = _loads(order_response)
         assert final_order["status"] == "confirmed"
-        
-        # Step 8: Verify cart is cleared
-        cart_response = api_client.get("/api/cart", headers=headers)
+
         assert cart_response.status_code == 200
-        
-        cart = cart_response.json()
+        cart = _loads(cart_response)
         assert len(cart["items"]) == 0
     
-    def test_inventory_management_workflow(self, api_client, authenticated_admin):
+    async def test_inventory_management_workflow(self, api_client, authenticated_admin):
         """Test inventory management workflow."""
         admin_id, token = authenticated_admin
         headers = {"Authorization": f"Bearer {token}"}
         
         # Step 1: Create new product
-        product_data = {
-            "name": "Test Product",
-            "description": "A test product for inventory management",
-            "price": 29.99,
-            "stock_quantity": 100,
-            "category": "Electronics"
-        }
-        
-        product_response = api_client.post("/api/admin/products", json=product_data, headers=headers)
+        product_response = await _post_json(api_client, "/api/admin/products", _PRODUCT_DATA, headers=headers)
         assert product_response.status_code == 201
         
-        product = product_response.json()
+        product = _loads(product_response)
         product_id = product["id"]
         
         # Step 2: Update inventory
@@ -228,14 +292,14 @@ class TestEcommerceWorkflow:
             "stock_quantity": 150
         }
         
-        update_response = api_client.put(f"/api/admin/products/{product_id}/inventory", json=inventory_update, headers=headers)
+        update_response = await _put_json(api_client, f"/api/admin/products/{product_id}/inventory", inventory_update, headers=headers)
         assert update_response.status_code == 200
         
         # Step 3: Verify inventory update
-        product_response = api_client.get(f"/api/admin/products/{product_id}", headers=headers)
+        product_response = await api_client.get(f"/api/admin/products/{product_id}", headers=headers)
         assert product_response.status_code == 200
         
-        updated_product = product_response.json()
+        updated_product = _loads(product_response)
         assert updated_product["stock_quantity"] == 150
         
         # Step 4: Test low stock alert
@@ -243,137 +307,193 @@ class TestEcommerceWorkflow:
             "stock_quantity": 5
         }
         
-        update_response = api_client.put(f"/api/admin/products/{product_id}/inventory", json=low_stock_update, headers=headers)
+        update_response = await _put_json(api_client, f"/api/admin/products/{product_id}/inventory", low_stock_update, headers=headers)
         assert update_response.status_code == 200
         
         # Step 5: Check low stock products
-        low_stock_response = api_client.get("/api/admin/products/low-stock", headers=headers)
+        low_stock_response = await api_client.get("/api/admin/products/low-stock", headers=headers)
         assert low_stock_response.status_code == 200
         
-        low_stock_products = low_stock_response.json()
+        low_stock_products = _loads(low_stock_response)
         assert any(p["id"] == product_id for p in low_stock_products)
 
 
 class TestNotificationWorkflow:
     """Test notification and communication workflows."""
     
-    def test_email_notification_workflow(self, api_client, authenticated_user):
+    async def test_email_notification_workflow(self, api_client, authenticated_user, _mock_services):
         """Test email notification workflow."""
         user_id, token = authenticated_user
         headers = {"Authorization": f"Bearer {token}"}
         
         # Step 1: Update notification preferences
-        notification_prefs = {
-            "email_notifications": True,
-            "order_updates": True,
-            "promotional_emails": False
-        }
-        
-        prefs_response = api_client.put("/api/users/notification-preferences", json=notification_prefs, headers=headers)
+        prefs_response = await _put_json(api_client, "/api/users/notification-preferences", _NOTIFICATION_PREFS, headers=headers)
         assert prefs_response.status_code == 200
         
         # Step 2: Create an order to trigger notification
-        order_data = {
-            "shipping_address": "123 Main St, Anytown, USA",
-            "payment_method": "card"
-        }
-        
-        with patch('app.services.email_service.send_order_confirmation') as mock_email:
-            mock_email.return_value = {"status": "sent", "message_id": "msg_123"}
-            
-            order_response = api_client.post("/api/orders", json=order_data, headers=headers)
-            assert order_response.status_code == 201
-            
-            # Verify email was sent
-            mock_email.assert_called_once()
+        mock_email = _mock_services["email_service"].send_order_confirmation
+        mock_email.return_value = {"status": "sent", "message_id": "msg_123"}
+
+        order_response = await _post_json(api_client, "/api/orders", _ORDER_DATA, headers=headers)
+        assert order_response.status_code == 201
+
+        # Verify email was sent
+        mock_email.assert_called_once()
     
-    def test_sms_notification_workflow(self, api_client, authenticated_user):
+    async def test_sms_notification_workflow(self, api_client, authenticated_user, _mock_services):
         """Test SMS notification workflow."""
         user_id, token = authenticated_user
         headers = {"Authorization": f"Bearer {token}"}
         
         # Step 1: Add phone number
-        phone_data = {
-            "phone_number": "+1234567890"
-        }
-        
-        phone_response = api_client.put("/api/users/phone", json=phone_data, headers=headers)
+        phone_response = await _put_json(api_client, "/api/users/phone", _PHONE_DATA, headers=headers)
         assert phone_response.status_code == 200
         
         # Step 2: Enable SMS notifications
-        sms_prefs = {
-            "sms_notifications": True,
-            "order_updates_sms": True
-        }
-        
-        prefs_response = api_client.put("/api/users/notification-preferences", json=sms_prefs, headers=headers)
+        prefs_response = await _put_json(api_client, "/api/users/notification-preferences", _SMS_PREFS, headers=headers)
         assert prefs_response.status_code == 200
         
         # Step 3: Test SMS sending (mock)
-        with patch('app.services.sms_service.send_sms') as mock_sms:
-            mock_sms.return_value = {"status": "sent", "message_id": "sms_123"}
-            
-            # Trigger SMS notification
-            test_data = {"message": "Test SMS notification"}
-            sms_response = api_client.post("/api/test/sms", json=test_data, headers=headers)
-            assert sms_response.status_code == 200
-            
-            # Verify SMS was sent
-            mock_sms.assert_called_once()
+        mock_sms = _mock_services["sms_service"].send_sms
+        mock_sms.return_value = {"status": "sent", "message_id": "sms_123"}
+
+        # Trigger SMS notification
+        test_data = {"message": "Test SMS notification"}
+        sms_response = await _post_json(api_client, "/api/test/sms", test_data, headers=headers)
+        assert sms_response.status_code == 200
+
+        # Verify SMS was sent
+        mock_sms.assert_called_once()
 
 
 # Fixtures for integration testing
+@pytest.fixture(scope="module", autouse=True)
+def _mock_services():
+    """Patch the external service modules once per module instead of
+    re-entering patch() inside every test. Tests pull the mock they need
+    out of the dict and configure it; _reset_service_mocks wipes
+    recorded calls between tests."""
+    with patch.multiple(
+        "app.services",
+        email_service=DEFAULT,
+        sms_service=DEFAULT,
+        payment_service=DEFAULT,
+        auth_service=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def _reset_service_mocks(_mock_services):
+    """Drop recorded calls and configured return values between tests so
+    the module-scoped mocks don't leak state."""
+    yield
+    for mock in _mock_services.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
-def api_client():
-    """Create API client for testing."""
+def unique_user():
+    """Collision-free username, so tests touching the users table can
+    run in parallel (pytest -n auto) without tripping unique
+    constraints."""
+    return f"testuser_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+def _transport():
+    """Build the ASGI transport once per session. Importing app.main and
+    constructing the middleware stack is the expensive read-only part;
+    per-test isolation comes from clean_db, not from rebuilding the app."""
     from app.main import app
-    return TestClient(app)
+    return ASGITransport(app=app)
 
 
 @pytest.fixture
-def authenticated_user(api_client):
+async def api_client(_transport):
+    """Create API client for testing.
+
+    Requests go through an in-process ASGI transport, so each call runs
+    on the test's own event loop instead of hopping through TestClient's
+    thread-pooled portal. Only the cheap AsyncClient wrapper is rebuilt
+    per test."""
+    async with AsyncClient(transport=_transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def db_session():
+    """Wrap each test in a transaction that is rolled back on teardown.
+
+    The app's DB dependency is overridden to hand out a session bound to
+    this connection, so every write a workflow makes lands inside the
+    outer transaction and disappears on rollback — cheaper isolation
+    than truncating tables, and it lets the session-scoped users below
+    survive from test to test."""
+    from sqlalchemy.orm import Session
+
+    from app.database import engine, get_db
+    from app.main import app
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    app.dependency_overrides[get_db] = lambda: session
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+async def _register_and_login(transport, user_data, login_data):
+    """Register the user (ignoring an already-exists response) and log
+    in, returning the access token."""
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await _post_json(client, "/api/users/register", user_data)
+        login_response = await client.post("/api/auth/login", data=login_data)
+        return _loads(login_response)["access_token"]
+
+
+# Registration pays the password-hash cost, so it happens once per
+# session; db_session rolls each test's writes back, which keeps these
+# rows (committed outside any test transaction) intact. asyncio.run is
+# used because pytest-asyncio's default loop is function-scoped.
+
+
+@pytest.fixture(scope="session")
+def authenticated_user(_transport):
     """Create an authenticated user for testing."""
-    # Create user
+    # Unique per session, so xdist workers (each running its own
+    # session) don't collide when registering against a shared database
+    username = f"testuser_{uuid.uuid4().hex[:8]}"
     user_data = {
-        "username": "testuser",
-        "email": "test@example.com",
+        "username": username,
+        "email": f"{username}@example.com",
         "password": "securepass123"
     }
-    
-    api_client.post("/api/users/register", json=user_data)
-    
-    # Login
     login_data = {
-        "username": "testuser",
+        "username": username,
         "password": "securepass123"
     }
-    
-    login_response = api_client.post("/api/auth/login", data=login_data)
-    token = login_response.json()["access_token"]
-    
+    token = asyncio.run(_register_and_login(_transport, user_data, login_data))
     return 1, token  # Assuming user ID is 1
 
 
-@pytest.fixture
-def authenticated_admin(api_client):
+@pytest.fixture(scope="session")
+def authenticated_admin(_transport):
     """Create an authenticated admin user for testing."""
-    # Create admin user
+    username = f"admin_{uuid.uuid4().hex[:8]}"
     admin_data = {
-        "username": "admin",
-        "email": "admin@example.com",
+        "username": username,
+        "email": f"{username}@example.com",
         "password": "adminpass123",
         "role": "admin"
     }
-    
-    api_client.post("/api/users/register", json=admin_data)
-    
-    # Login
     login_data = {
-        "username": "admin",
+        "username": username,
         "password": "adminpass123"
     }
-    
-    login_response = api_client.post("/api/auth/login", data=login_data)
-    token = login_response.json()["access_token"]
-    
+    token = asyncio.run(_register_and_login(_transport, admin_data, login_data))
     return 2, token  # Assuming admin ID is 2 
\ No newline at end of file
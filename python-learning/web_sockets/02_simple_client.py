@@ -6,6 +6,10 @@ This client connects to the server and sends a few test messages
 import asyncio
 import websockets
 
+async def _recv_n(websocket, count):
+    """Reader task: collect the next `count` responses"""
+    return [await websocket.recv() for _ in range(count)]
+
 async def simple_client():
     """Simple WebSocket client"""
     # Server address
@@ -24,20 +28,20 @@ async def simple_client():
                 "This is my second message",
                 "Goodbye!"
             ]
-            
+
+            # Pipeline the exchange: a reader task collects the
+            # responses while all messages are sent back to back, so
+            # the total time is about one round trip instead of one
+            # round trip plus a 1-second sleep per message
+            reader = asyncio.create_task(_recv_n(websocket, len(test_messages)))
+
             for message in test_messages:
-                print(f"\nSending: {message}")
-                
-                # Send message to server
+                print(f"Sending: {message}")
                 await websocket.send(message)
-                
-                # Wait for response
-                response = await websocket.recv()
+
+            for response in await reader:
                 print(f"Received: {response}")
                 
-                # Small delay between messages
-                await asyncio.sleep(1)
-                
     except websockets.exceptions.ConnectionRefused:
         print("❌ Could not connect to server!")
         print("Make sure the server is running: python 01_simple_server.py")
@@ -4,43 +4,67 @@ Multiple clients can connect and chat with each other
 """
 
 import asyncio
+import itertools
 import websockets
 
-# Keep track of all connected clients
-connected_clients = []
+# uvloop (libuv event loop) is a drop-in that speeds up socket-heavy
+# asyncio work; fall back to the stdlib loop when it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Keep track of all connected clients: each one owns an outgoing queue.
+# Broadcasting drops the message into every queue without awaiting, and
+# a per-client writer task drains its own queue — so a slow client only
+# delays itself instead of holding up the whole room.
+connected_clients = {}
+_client_ids = itertools.count(1)
+
+async def _drain(websocket, queue):
+    """Writer task: forward queued messages to one client"""
+    try:
+        while True:
+            await websocket.send(await queue.get())
+    except websockets.exceptions.ConnectionClosed:
+        pass
 
 async def chat_handler(websocket, path):
     """Handle chat client connections"""
-    # Add this client to our list
-    connected_clients.append(websocket)
-    client_id = len(connected_clients)
-    
+    # Add this client to our registry and start its writer
+    queue = asyncio.Queue()
+    connected_clients[websocket] = queue
+    # Monotonic ids: len(connected_clients) would hand out duplicate
+    # ids once clients start disconnecting
+    client_id = next(_client_ids)
+    writer = asyncio.create_task(_drain(websocket, queue))
+
     print(f"Client {client_id} connected! Total clients: {len(connected_clients)}")
-    
+
     try:
-        # Send welcome message
-        welcome = f"Welcome! You are client {client_id}"
-        await websocket.send(welcome)
-        
+        # Send welcome message (through the queue, so only the writer
+        # task ever writes to the socket)
+        queue.put_nowait(f"Welcome! You are client {client_id}")
+
         # Listen for messages from this client
         async for message in websocket:
             print(f"Client {client_id}: {message}")
-            
-            # Send message to all other clients
-            for client in connected_clients:
+
+            # Build the payload once instead of re-formatting it per
+            # recipient. It stays a str so clients keep receiving text
+            # frames (the chat client prints messages verbatim).
+            payload = f"Client {client_id}: {message}"
+            for client, client_queue in connected_clients.items():
                 if client != websocket:  # Don't send back to sender
-                    try:
-                        await client.send(f"Client {client_id}: {message}")
-                    except:
-                        # Remove disconnected clients
-                        connected_clients.remove(client)
-                        
+                    client_queue.put_nowait(payload)
+
     except websockets.exceptions.ConnectionClosed:
         print(f"Client {client_id} disconnected!")
     finally:
         # Remove client when they disconnect
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+        connected_clients.pop(websocket, None)
+        writer.cancel()
         print(f"Client {client_id} left. Total clients: {len(connected_clients)}")
 
 async def main():
@@ -49,12 +73,22 @@ async def main():
     print("Server will run on: ws://localhost:8765")
     print("Multiple clients can connect and chat!")
     print("Press Ctrl+C to stop the server")
-    
-    server = await websockets.serve(chat_handler, "localhost", 8765)
+
+    # Broadcasts repeat the same short lines to every client, which
+    # deflate compresses well; the larger write buffer batches sends
+    # into fewer syscalls
+    server = await websockets.serve(
+        chat_handler, "localhost", 8765,
+        compression="deflate",
+        max_size=2**20,
+        write_limit=2**20,
+        ping_interval=20,
+        ping_timeout=20,
+    )
     await server.wait_closed()
 
 if __name__ == "__main__":
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nServer stopped!") 
\ No newline at end of file
+        print("\nServer stopped!")
@@ -23,11 +23,14 @@ async def chat_client():
             # Create two tasks: one for sending, one for receiving
             async def receive_messages():
                 """Receive and display messages"""
+                # Catch only the connection going away: a bare except
+                # would also swallow CancelledError and keep this task
+                # alive after asyncio.wait cancels it
                 try:
                     async for message in websocket:
                         print(f"\n{message}")
                         print(f"{name}: ", end="", flush=True)
-                except:
+                except websockets.exceptions.ConnectionClosed:
                     print("\nConnection lost!")
             
             async def send_messages():
@@ -38,7 +41,7 @@ async def chat_client():
                         if message.lower() in ['quit', 'exit', 'bye']:
                             break
                         await websocket.send(message)
-                except:
+                except websockets.exceptions.ConnectionClosed:
                     pass
             
             # Run both tasks at the same time
@@ -63,6 +66,3 @@ async def chat_client():
 
 if __name__ == "__main__":
     asyncio.run(chat_client())
-```
-
-```
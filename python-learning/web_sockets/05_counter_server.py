@@ -4,57 +4,101 @@ Server that keeps a counter and sends updates to all clients
 """
 
 import asyncio
+import itertools
+import struct
 import websockets
 
-# Keep track of connected clients and counter
-connected_clients = []
+# uvloop (libuv event loop) is a drop-in that speeds up socket-heavy
+# asyncio work; fall back to the stdlib loop when it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Keep track of connected clients and counter. Each client owns an
+# outgoing queue drained by its own writer task, so broadcasting the
+# counter never blocks on a slow client.
+connected_clients = {}
+_client_ids = itertools.count(1)
 counter = 0
+pending = asyncio.Event()
+
+# Binary counter protocol: 1-byte opcode + 4-byte little-endian value.
+# 5 bytes on the wire instead of a formatted string, and clients unpack
+# an int instead of parsing text. The greeting stays text.
+OP_COUNTER = 1
+OP_RESET = 2
+
+async def _drain(websocket, queue):
+    """Writer task: forward queued messages to one client"""
+    try:
+        while True:
+            await websocket.send(await queue.get())
+    except websockets.exceptions.ConnectionClosed:
+        pass
+
+def _broadcast(payload):
+    """Queue a pre-built frame for every client — no awaits, so no
+    client can stall the fanout, and the same bytes object goes to all
+    N clients."""
+    for queue in connected_clients.values():
+        queue.put_nowait(payload)
+
+async def _coalesced_broadcaster():
+    """Background task that batches bursts of increments: once an
+    increment is pending it waits 10 ms, then broadcasts the latest
+    value once. K increments in a burst cost one broadcast, not K."""
+    while True:
+        await pending.wait()
+        await asyncio.sleep(0.01)
+        # Clear before reading so an increment landing mid-broadcast
+        # re-arms the event and gets its own follow-up broadcast
+        pending.clear()
+        _broadcast(struct.pack("<BI", OP_COUNTER, counter))
 
 async def counter_handler(websocket, path):
     """Handle counter client connections"""
     global counter
-    
-    # Add this client to our list
-    connected_clients.append(websocket)
-    client_id = len(connected_clients)
-    
+
+    # Add this client to our registry and start its writer
+    queue = asyncio.Queue()
+    connected_clients[websocket] = queue
+    # Monotonic ids: len(connected_clients) would hand out duplicate
+    # ids once clients start disconnecting
+    client_id = next(_client_ids)
+    writer = asyncio.create_task(_drain(websocket, queue))
+
     print(f"Client {client_id} connected! Total clients: {len(connected_clients)}")
-    
+
     # Send current counter value to new client
-    await websocket.send(f"Current counter: {counter}")
-    
+    queue.put_nowait(f"Current counter: {counter}")
+
     try:
         # Listen for messages from this client
         async for message in websocket:
             print(f"Client {client_id} sent: {message}")
-            
+
             if message.lower() == "increment":
                 counter += 1
                 print(f"Counter incremented to: {counter}")
-                
-                # Send new counter value to all clients
-                for client in connected_clients:
-                    try:
-                        await client.send(f"Counter: {counter}")
-                    except:
-                        connected_clients.remove(client)
-                        
+
+                # Flag the change; the coalescing broadcaster sends the
+                # latest value to all clients shortly after
+                pending.set()
+
             elif message.lower() == "reset":
                 counter = 0
                 print("Counter reset to 0")
-                
+
                 # Send reset message to all clients
-                for client in connected_clients:
-                    try:
-                        await client.send("Counter reset to 0")
-                    except:
-                        connected_clients.remove(client)
-                        
+                _broadcast(struct.pack("<BI", OP_RESET, 0))
+
     except websockets.exceptions.ConnectionClosed:
         print(f"Client {client_id} disconnected!")
     finally:
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+        connected_clients.pop(websocket, None)
+        writer.cancel()
         print(f"Client {client_id} left. Total clients: {len(connected_clients)}")
 
 async def main():
@@ -63,12 +107,25 @@ async def main():
     print("Server will run on: ws://localhost:8765")
     print("Clients can send 'increment' or 'reset' messages")
     print("Press Ctrl+C to stop the server")
-    
-    server = await websockets.serve(counter_handler, "localhost", 8765)
-    await server.wait_closed()
+
+    broadcaster = asyncio.create_task(_coalesced_broadcaster())
+    # Counter updates are highly repetitive text, so deflate pays for
+    # itself; the larger write buffer batches sends into fewer syscalls
+    server = await websockets.serve(
+        counter_handler, "localhost", 8765,
+        compression="deflate",
+        max_size=2**20,
+        write_limit=2**20,
+        ping_interval=20,
+        ping_timeout=20,
+    )
+    try:
+        await server.wait_closed()
+    finally:
+        broadcaster.cancel()
 
 if __name__ == "__main__":
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nServer stopped!") 
\ No newline at end of file
+        print("\nServer stopped!")
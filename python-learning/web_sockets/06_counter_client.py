@@ -4,9 +4,14 @@ Client that can increment and reset a shared counter
 """
 
 import asyncio
+import struct
 import websockets
 import aioconsole
 
+# Must match the server's binary protocol: 1-byte opcode + 4-byte value
+OP_COUNTER = 1
+OP_RESET = 2
+
 async def counter_client():
     """Interactive counter client"""
     server_url = "ws://localhost:8765"
@@ -21,11 +26,23 @@ async def counter_client():
             # Create two tasks: one for receiving, one for sending
             async def receive_messages():
                 """Receive and display messages"""
+                # Catch only the connection going away: a bare except
+                # would also swallow CancelledError and keep this task
+                # alive after asyncio.wait cancels it
                 try:
                     async for message in websocket:
-                        print(f"\n{message}")
+                        if isinstance(message, bytes):
+                            # Binary counter frame: no string parsing
+                            op, value = struct.unpack("<BI", message)
+                            if op == OP_RESET:
+                                print("\nCounter reset to 0")
+                            else:
+                                print(f"\nCounter: {value}")
+                        else:
+                            # Text fallback (the connection greeting)
+                            print(f"\n{message}")
                         print("Command: ", end="", flush=True)
-                except:
+                except websockets.exceptions.ConnectionClosed:
                     print("\nConnection lost!")
             
             async def send_commands():
@@ -36,7 +53,7 @@ async def counter_client():
                         if command.lower() in ['quit', 'exit']:
                             break
                         await websocket.send(command)
-                except:
+                except websockets.exceptions.ConnectionClosed:
                     pass
             
             # Run both tasks at the same time
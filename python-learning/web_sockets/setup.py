@@ -10,6 +10,16 @@ import os
 def install_requirements():
     """Install required packages"""
     print("Installing required packages...")
+    # Prefer uv when it's on PATH: its resolver/installer is much
+    # faster than spawning a fresh pip interpreter
+    try:
+        subprocess.check_call(["uv", "pip", "install", "-r", "requirements.txt"])
+        print("✅ All packages installed successfully!")
+        return True
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        # uv missing or unusable (e.g. no virtualenv for it to target)
+        # — fall back to pip below
+        pass
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
         print("✅ All packages installed successfully!")
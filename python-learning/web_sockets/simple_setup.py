@@ -6,11 +6,23 @@ Simple setup script for WebSocket examples
 import subprocess
 import sys
 
+PACKAGES = ["websockets", "aioconsole", "uvloop"]
+
 def install_requirements():
     """Install required packages"""
     print("Installing required packages...")
+    # Prefer uv when it's on PATH: its resolver/installer is much
+    # faster than spawning a fresh pip interpreter
+    try:
+        subprocess.check_call(["uv", "pip", "install"] + PACKAGES)
+        print("✅ Packages installed successfully!")
+        return True
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        # uv missing or unusable (e.g. no virtualenv for it to target)
+        # — fall back to pip below
+        pass
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "websockets", "aioconsole"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install"] + PACKAGES)
         print("✅ Packages installed successfully!")
         return True
     except subprocess.CalledProcessError as e: